@@ -1,14 +1,17 @@
+import functools
 import json
 import re
 import shlex
 import threading
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import Any, get_type_hints
+from types import SimpleNamespace
+from typing import Any, Callable, Collection
 from urllib.error import URLError
 from urllib.request import Request, urlopen
 from uuid import UUID
 
+import tomlkit
 from endstone import Player
 from endstone.command import Command, CommandSender
 from endstone.event import (
@@ -23,13 +26,63 @@ from endstone.event import (
 )
 from endstone.plugin import Plugin
 
+from ._msgs import (
+    CHAT_PREFIX,
+    FMT_ALLY_FORMED,
+    FMT_ALLY_REMOVED,
+    FMT_NOT_IN_A_PARTY,
+    FMT_PLAYER_BANNED,
+    FMT_PLAYER_UNBANNED,
+    HEADER_ACHIEVEMENTS,
+    HEADER_ACTIVE_PARTIES,
+    HEADER_JOIN_REQUESTS,
+    HEADER_LEADERBOARD,
+    HEADER_PARTY_ALLIES,
+    HEADER_PARTY_INFO,
+    HEADER_PARTY_MEMBERS,
+    HEADER_PARTY_STATS,
+    HEADER_PLUGIN_HEALTH,
+    MSG_FF_DISABLED,
+    MSG_FOOTER,
+    MSG_NOT_IN_YOUR_PARTY,
+    MSG_NO_INVITE,
+    MSG_NO_JOIN_REQUEST,
+    MSG_NO_PERMISSION,
+    MSG_PLAYER_NOT_FOUND,
+    MSG_PLAYER_ONLY,
+    MSG_TARGET_NOT_IN_PARTY,
+    OFFLINE_PREFIX,
+    OFFLINE_SUFFIX,
+    ONLINE_PREFIX,
+    ONLINE_SUFFIX,
+    PARTY_ADMIN_HELP_TEXT,
+    PARTY_HELP_TEXT,
+    USAGE_ACCEPTREQUEST,
+    USAGE_ADMIN_DISBAND,
+    USAGE_ADMIN_INFO,
+    USAGE_ADMIN_TELEPORT,
+    USAGE_ALLY,
+    USAGE_BAN,
+    USAGE_COLOR,
+    USAGE_DENYREQUEST,
+    USAGE_ICON,
+    USAGE_INVITE,
+    USAGE_JOIN,
+    USAGE_KICK,
+    USAGE_LEADERBOARD,
+    USAGE_NAME,
+    USAGE_PROMOTE,
+    USAGE_SETRANK,
+    USAGE_UNBAN,
+)
 from .achievement_manager import PartyAchievementManager
 from .hud_manager import HUDManager
 from .leaderboard_manager import PartyLeaderboardManager
-from .models import LocationData, Party, PartyRole, now_ms
+from .models import Party, PartyRole, now_ms
 from .party_manager import PartyManager
 from .scoreboard_manager import PartyScoreboardManager
 from .party_show_manager import PartyShowManager
+from .templates import CompiledTemplate, compile_template, render_template
 
 DEFAULT_CONFIG_TOML = """
 [party]
@@ -163,6 +216,79 @@ already-leader = "\u00a7cYou are the party leader."
 party-name-set = "\u00a7aParty name set to: \u00a7e{name}\u00a7a!"
 """.strip()
 
+# Parsed once at import: the bytes written on first run, and the values get_config
+# falls back to when a key is missing from the user's config.toml.
+_DEFAULT_CONFIG_BYTES = (DEFAULT_CONFIG_TOML + "\n").encode("utf-8")
+_DEFAULT_CONFIG: dict[str, Any] = tomlkit.parse(DEFAULT_CONFIG_TOML).unwrap()
+
+_MISSING = object()
+
+_FRIENDLY_FIRE_NOTICE_LIMIT = 1024
+
+# (config path, attribute on EuphoriaPartiesPlugin._cfg, cast, default) for values read on hot paths.
+_HOT_CONFIG_SPECS: tuple[tuple[str, str, Any, Any], ...] = (
+    ("party.notify-online-offline", "notify_online", bool, True),
+    ("party.prevent-friendly-fire", "prevent_ff", bool, True),
+    ("party.friendly-fire-message-cooldown-ms", "ff_cooldown_ms", int, 1500),
+    ("party.party-chat-enabled", "chat_enabled", bool, True),
+    ("party.party-chat-prefix", "chat_prefix", str, "@"),
+    ("party.party-chat-format", "chat_template", compile_template, "\u00a78[\u00a76Party\u00a78] \u00a7f{player}\u00a77: \u00a7f{message}"),
+    ("party.show-party-in-chat", "show_in_chat", bool, True),
+    ("party.party-prefix-format", "prefix_template", compile_template, "\u00a78[\u00a76{party}\u00a78] "),
+    ("party.respawn-at-home", "respawn_home", bool, False),
+    ("performance.auto-save-interval", "autosave_interval", int, 6000),
+)
+
+# Lookup tables for /party color and /party setrank.
+_COLOR_CODES = {
+    "gold": "\u00a76",
+    "yellow": "\u00a7e",
+    "green": "\u00a7a",
+    "aqua": "\u00a7b",
+    "red": "\u00a7c",
+    "purple": "\u00a75",
+    "white": "\u00a7f",
+    "gray": "\u00a77",
+    "blue": "\u00a79",
+    "dark_green": "\u00a72",
+}
+_ASSIGNABLE_ROLES = {
+    "officer": PartyRole.OFFICER,
+    "member": PartyRole.MEMBER,
+    "recruit": PartyRole.RECRUIT,
+}
+
+
+def _requires_party(handler: Callable[..., bool]) -> Callable[..., bool]:
+    """Resolve the sender's party once and pass it to the handler after the player."""
+
+    @functools.wraps(handler)
+    def wrapper(self: "EuphoriaPartiesPlugin", player: Player, *args: Any) -> bool:
+        party = self.party_manager.get_player_party(player.unique_id)
+        if party is None:
+            player.send_message(self.msg("not-in-party"))
+            return True
+        return handler(self, player, party, *args)
+
+    return wrapper
+
+
+def _requires_leader(handler: Callable[..., bool]) -> Callable[..., bool]:
+    """Like _requires_party, but also rejects senders who do not lead the party."""
+
+    @functools.wraps(handler)
+    def wrapper(self: "EuphoriaPartiesPlugin", player: Player, *args: Any) -> bool:
+        party = self.party_manager.get_player_party(player.unique_id)
+        if party is None:
+            player.send_message(self.msg("not-in-party"))
+            return True
+        if not party.is_leader(player.unique_id):
+            player.send_message(self.msg("not-party-leader"))
+            return True
+        return handler(self, player, party, *args)
+
+    return wrapper
+
 
 class EuphoriaPartiesPlugin(Plugin):
     version = "2.0.3"
@@ -229,27 +355,6 @@ class EuphoriaPartiesPlugin(Plugin):
     }
 
     permissions = {
-        "euphoria.*": {
-            "description": "All Euphoria plugin permissions",
-            "default": "op",
-            "children": {
-                "euphoria.party.*": True,
-                "euphoria.party.admin": True,
-                "euphoria.hud.*": True,
-            },
-        },
-        "euphoria.party.*": {
-            "description": "All party permissions",
-            "default": True,
-            "children": {
-                "euphoria.party.use": True,
-                "euphoria.party.create": True,
-                "euphoria.party.invite": True,
-                "euphoria.party.kick": True,
-                "euphoria.party.promote": True,
-                "euphoria.party.sethome": True,
-            },
-        },
         "euphoria.party.use": {"description": "Use party commands", "default": True},
         "euphoria.party.create": {"description": "Create a party", "default": True},
         "euphoria.party.invite": {"description": "Invite players to party", "default": True},
@@ -257,40 +362,110 @@ class EuphoriaPartiesPlugin(Plugin):
         "euphoria.party.promote": {"description": "Promote players and set ranks", "default": True},
         "euphoria.party.sethome": {"description": "Set party home location", "default": True},
         "euphoria.party.admin": {"description": "Party administration permissions", "default": "op"},
-        "euphoria.hud.*": {
-            "description": "All HUD permissions",
-            "default": True,
-            "children": {"euphoria.hud.coordinates": True, "euphoria.hud.compass": True},
-        },
         "euphoria.hud.coordinates": {"description": "Toggle coordinate display", "default": True},
         "euphoria.hud.compass": {"description": "Toggle compass display", "default": True},
     }
 
+    _COMMAND_HANDLERS = {
+        "party": "_handle_party_command",
+        "partyadmin": "_handle_party_admin_command",
+        "coordinates": "_handle_coordinates_command",
+        "compass": "_handle_compass_command",
+    }
+
+    # Subcommand name/alias -> handler method name. Handlers in the first table take
+    # only the player, handlers in the second also receive the remaining tokens.
+    _PARTY_SUBCOMMANDS = {
+        "create": "_party_create",
+        "accept": "_party_accept",
+        "leave": "_party_leave",
+        "list": "_party_list",
+        "info": "_party_info",
+        "sethome": "_party_sethome",
+        "home": "_party_home",
+        "warp": "_party_warp",
+        "warpleader": "_party_warp",
+        "requests": "_party_requests",
+        "public": "_party_public",
+        "private": "_party_private",
+        "stats": "_party_stats",
+        "daily": "_party_daily",
+        "dailyreward": "_party_daily",
+        "scoreboard": "_party_scoreboard",
+        "sb": "_party_scoreboard",
+        "show": "_party_show",
+        "achievements": "_party_achievements",
+        "achievement": "_party_achievements",
+    }
+    _PARTY_SUBCOMMANDS_WITH_ARGS = {
+        "invite": "_party_invite",
+        "kick": "_party_kick",
+        "promote": "_party_promote",
+        "name": "_party_name",
+        "join": "_party_join",
+        "acceptrequest": "_party_accept_request",
+        "arequest": "_party_accept_request",
+        "denyrequest": "_party_deny_request",
+        "drequest": "_party_deny_request",
+        "setrank": "_party_setrank",
+        "ban": "_party_ban",
+        "unban": "_party_unban",
+        "color": "_party_color",
+        "icon": "_party_icon",
+        "ally": "_party_ally",
+        "leaderboard": "_party_leaderboard",
+        "lb": "_party_leaderboard",
+        "top": "_party_leaderboard",
+    }
+
+    _ADMIN_SUBCOMMANDS = {
+        "list": "_admin_list",
+        "reload": "_admin_reload",
+        "health": "_admin_health",
+    }
+    _ADMIN_SUBCOMMANDS_WITH_ARGS = {
+        "info": "_admin_info",
+        "disband": "_admin_disband",
+        "teleport": "_admin_teleport",
+    }
+
+    # Managers only needed by stat changes and a few subcommands; see __getattr__.
+    _LAZY_MANAGERS: dict[str, Any] = {
+        "achievement_manager": PartyAchievementManager,
+        "leaderboard_manager": PartyLeaderboardManager,
+    }
+    achievement_manager: PartyAchievementManager
+    leaderboard_manager: PartyLeaderboardManager
+
     def __init__(self) -> None:
         super().__init__()
         self.party_manager: PartyManager
         self.hud_manager: HUDManager
         self.scoreboard_manager: PartyScoreboardManager
         self.show_manager: PartyShowManager
-        self.achievement_manager: PartyAchievementManager
-        self.leaderboard_manager: PartyLeaderboardManager
         self._autosave_task = None
         self._update_check_thread: threading.Thread | None = None
-        self._pending_respawns: dict[UUID, LocationData] = {}
         self._last_friendly_fire_notice_ms: dict[UUID, int] = {}
+        self._config_cache: dict[str, Any] = {}
+        self._cfg = SimpleNamespace(**{attr: cast(default) for _, attr, cast, default in _HOT_CONFIG_SPECS})
+        self._msg_prefix = "\u00a78[\u00a76Party\u00a78]\u00a7r "
+        self._msg_templates: dict[str, CompiledTemplate] = {}
 
     def on_enable(self) -> None:
         self._ensure_default_config()
         self.reload_config()
 
+        # Lazily built managers from a previous enable still point at the old party data.
+        for name in self._LAZY_MANAGERS:
+            self.__dict__.pop(name, None)
+
         self.party_manager = PartyManager(self)
         self.hud_manager = HUDManager(self)
         self.scoreboard_manager = PartyScoreboardManager(self)
         self.show_manager = PartyShowManager(self)
-        self.achievement_manager = PartyAchievementManager(self)
-        self.leaderboard_manager = PartyLeaderboardManager(self)
 
-        self._resolve_event_handler_annotations()
+        if _DEFERRED_ANNOTATIONS:
+            self._resolve_event_handler_annotations()
         self.register_events(self)
 
         self.party_manager.start()
@@ -302,6 +477,16 @@ class EuphoriaPartiesPlugin(Plugin):
 
         self.logger.info("EuphoriaParties (Endstone) enabled")
 
+    def __getattr__(self, name: str) -> Any:
+        # Only reached when normal lookup fails, so the managers below are built on first use.
+        # A property would not stay lazy: register_events getattr()s every name in dir(self).
+        factory = EuphoriaPartiesPlugin._LAZY_MANAGERS.get(name)
+        if factory is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        manager = factory(self)
+        setattr(self, name, manager)
+        return manager
+
     def on_disable(self) -> None:
         self._cancel_autosave_task()
         if hasattr(self, "hud_manager"):
@@ -315,36 +500,26 @@ class EuphoriaPartiesPlugin(Plugin):
         self.logger.info("EuphoriaParties (Endstone) disabled")
 
     def on_command(self, sender: CommandSender, command: Command, args: list[str]) -> bool:
-        command_name = command.name.lower()
-        if command_name == "party":
-            return self._handle_party_command(sender, args)
-        if command_name == "partyadmin":
-            return self._handle_party_admin_command(sender, args)
-        if command_name == "coordinates":
-            return self._handle_coordinates_command(sender)
-        if command_name == "compass":
-            return self._handle_compass_command(sender)
-        return False
+        handler_name = self._COMMAND_HANDLERS.get(command.name)
+        if handler_name is None:
+            return False
+        return getattr(self, handler_name)(sender, args)
 
     @event_handler
     def on_player_join(self, event: PlayerJoinEvent) -> None:
         player = event.player
         self.party_manager.record_player_name(player)
+        self.party_manager.record_player_online(player)
         self.show_manager.record_player_online(player.unique_id)
 
-        if not bool(self.get_config("party.notify-online-offline", True)):
+        if not self._cfg.notify_online:
             return
 
         party = self.party_manager.get_player_party(player.unique_id)
         if party is None:
             return
 
-        for member_id in party.members:
-            if member_id == player.unique_id:
-                continue
-            member = self.server.get_player(member_id)
-            if member is not None:
-                member.send_message(f"\u00a7a+ \u00a77{player.name} \u00a7ais now online")
+        self._notify_party_presence(party, player, ONLINE_PREFIX + player.name + ONLINE_SUFFIX)
 
     @event_handler
     def on_player_quit(self, event: PlayerQuitEvent) -> None:
@@ -356,34 +531,37 @@ class EuphoriaPartiesPlugin(Plugin):
         self.show_manager.record_player_offline(player_id)
         self.show_manager.remove_player(player_id)
         self.party_manager.cleanup_player_state(player_id)
+        self.party_manager.record_player_offline(player_id)
         self._last_friendly_fire_notice_ms.pop(player_id, None)
 
         party = self.party_manager.get_player_party(player_id)
         if party is None:
             return
 
-        if bool(self.get_config("party.notify-online-offline", True)):
-            for member_id in party.members:
-                if member_id == player_id:
-                    continue
-                member = self.server.get_player(member_id)
-                if member is not None:
-                    member.send_message(f"\u00a7c- \u00a77{player.name} \u00a7cis now offline")
+        if self._cfg.notify_online:
+            self._notify_party_presence(party, player, OFFLINE_PREFIX + player.name + OFFLINE_SUFFIX)
 
-        self.party_manager.check_party_cleanup(party.id)
+        self.party_manager.check_party_cleanup(party)
+
+    def _notify_party_presence(self, party: Party, player: Player, message: str) -> None:
+        player_id = player.unique_id
+        online_players = self.party_manager.online_players
+        for member_id in party.member_snapshot:
+            if member_id != player_id and (member := online_players.get(member_id)) is not None:
+                member.send_message(message)
 
     @event_handler
     def on_player_chat(self, event: PlayerChatEvent) -> None:
         player = event.player
         message = event.message
 
-        chat_prefix = str(self.get_config("party.party-chat-prefix", "@"))
-        if bool(self.get_config("party.party-chat-enabled", True)) and message.startswith(chat_prefix):
+        chat_prefix = self._cfg.chat_prefix
+        if self._cfg.chat_enabled and message.startswith(chat_prefix):
             event.is_cancelled = True
             self._handle_party_chat(player, message[len(chat_prefix) :].strip())
             return
 
-        if not bool(self.get_config("party.show-party-in-chat", True)):
+        if not self._cfg.show_in_chat:
             return
 
         party = self.party_manager.get_player_party(player.unique_id)
@@ -391,48 +569,44 @@ class EuphoriaPartiesPlugin(Plugin):
             return
 
         event.is_cancelled = True
-        prefix_format = str(self.get_config("party.party-prefix-format", "\u00a78[\u00a76{party}\u00a78] "))
-        prefix = prefix_format.replace("{party}", party.name)
+        prefix = render_template(self._cfg.prefix_template, {"party": party.name})
         self.server.broadcast_message(f"{prefix}<{player.name}> {message}")
 
     @event_handler
     def on_actor_damage(self, event: ActorDamageEvent) -> None:
-        if not bool(self.get_config("party.prevent-friendly-fire", True)):
+        if not self._cfg.prevent_ff:
             return
 
         victim = event.actor
         if not isinstance(victim, Player):
             return
 
-        source = event.damage_source
-        attacker = getattr(source, "damaging_actor", None) or getattr(source, "actor", None)
+        attacker = _resolve_attacker(event.damage_source)
         if not isinstance(attacker, Player):
             return
 
         victim_party = self.party_manager.get_player_party(victim.unique_id)
-        if victim_party is None:
-            return
-
-        attacker_party = self.party_manager.get_player_party(attacker.unique_id)
-        if attacker_party is None or attacker_party.id != victim_party.id:
+        if victim_party is None or self.party_manager.get_player_party(attacker.unique_id) is not victim_party:
             return
 
         event.is_cancelled = True
-        cooldown_ms = max(0, int(self.get_config("party.friendly-fire-message-cooldown-ms", 1500)))
+        cooldown_ms = self._cfg.ff_cooldown_ms
         if cooldown_ms <= 0:
-            attacker.send_message("\u00a7cFriendly fire is disabled for party members.")
+            attacker.send_message(MSG_FF_DISABLED)
+            return
+
+        # Sustained combat mostly lands here with the notice still on cooldown.
+        attacker_id = attacker.unique_id
+        current_ms = _monotonic_ms()
+        if current_ms - self._last_friendly_fire_notice_ms.get(attacker_id, 0) < cooldown_ms:
             return
 
-        current_ms = now_ms()
-        last_notice_ms = self._last_friendly_fire_notice_ms.get(attacker.unique_id, 0)
-        if current_ms - last_notice_ms >= cooldown_ms:
-            self._last_friendly_fire_notice_ms[attacker.unique_id] = current_ms
-            attacker.send_message("\u00a7cFriendly fire is disabled for party members.")
+        self._last_friendly_fire_notice_ms[attacker_id] = current_ms
+        attacker.send_message(MSG_FF_DISABLED)
 
     @event_handler
     def on_actor_death(self, event: ActorDeathEvent) -> None:
-        source = event.damage_source
-        attacker = getattr(source, "damaging_actor", None) or getattr(source, "actor", None)
+        attacker = _resolve_attacker(event.damage_source)
         if not isinstance(attacker, Player):
             return
 
@@ -442,7 +616,7 @@ class EuphoriaPartiesPlugin(Plugin):
 
         party.increment_kills()
         self.achievement_manager.check(party)
-        self.party_manager.mark_dirty()
+        self.party_manager.mark_dirty(party.id)
 
     @event_handler
     def on_player_death(self, event: PlayerDeathEvent) -> None:
@@ -453,15 +627,16 @@ class EuphoriaPartiesPlugin(Plugin):
 
         party.increment_deaths()
         self.achievement_manager.check(party)
-        self.party_manager.mark_dirty()
-
-        if bool(self.get_config("party.respawn-at-home", False)) and party.home is not None:
-            self._pending_respawns[player.unique_id] = party.home
+        self.party_manager.mark_dirty(party.id)
 
     @event_handler
     def on_player_respawn(self, event: PlayerRespawnEvent) -> None:
+        if not self._cfg.respawn_home:
+            return
+
         player = event.player
-        home_data = self._pending_respawns.pop(player.unique_id, None)
+        party = self.party_manager.get_player_party(player.unique_id)
+        home_data = party.home if party is not None else None
         if home_data is None:
             return
 
@@ -477,12 +652,16 @@ class EuphoriaPartiesPlugin(Plugin):
     def _resolve_event_handler_annotations(self) -> None:
         # Endstone validates handlers by checking that the event annotation is an Event subclass.
         # When annotations are deferred as strings, we eagerly resolve them here.
-        for attr_name in dir(self):
-            handler = getattr(self, attr_name)
-            if not callable(handler) or not getattr(handler, "_is_event_handler", False):
+        cls = type(self)
+        if cls.__dict__.get("_event_annotations_resolved", False):
+            return
+
+        from typing import get_type_hints
+
+        for function_obj in vars(cls).values():
+            if not getattr(function_obj, "_is_event_handler", False):
                 continue
 
-            function_obj = getattr(handler, "__func__", handler)
             annotations = getattr(function_obj, "__annotations__", None)
             if not isinstance(annotations, dict):
                 continue
@@ -490,7 +669,7 @@ class EuphoriaPartiesPlugin(Plugin):
                 continue
 
             try:
-                hints = get_type_hints(function_obj, globalns=globals(), localns=vars(type(self)))
+                hints = get_type_hints(function_obj, globalns=globals(), localns=vars(cls))
             except Exception:
                 continue
 
@@ -498,34 +677,51 @@ class EuphoriaPartiesPlugin(Plugin):
             if resolved_event is not None:
                 annotations["event"] = resolved_event
 
+        # Annotations are patched in place on the class, so re-enables have nothing left to do.
+        cls._event_annotations_resolved = True
+
+    def reload_config(self) -> dict:
+        config = super().reload_config()
+        self._config_cache.clear()
+        self._cfg = SimpleNamespace(
+            **{attr: cast(self.get_config(path, default)) for path, attr, cast, default in _HOT_CONFIG_SPECS}
+        )
+        self._refresh_message_templates()
+        return config
+
+    def _refresh_message_templates(self) -> None:
+        templates = {key: str(value) for key, value in _DEFAULT_CONFIG.get("messages", {}).items()}
+        configured = self.get_config("messages", {})
+        if isinstance(configured, dict):
+            templates.update((str(key), str(value)) for key, value in configured.items())
+        self._msg_prefix = templates.get("prefix", self._msg_prefix)
+        self._msg_templates = {key: compile_template(value) for key, value in templates.items()}
+
     def get_config(self, path: str, default: Any = None) -> Any:
-        cursor: Any = self.config
-        for segment in path.split("."):
-            try:
-                if segment not in cursor:
-                    return default
-                cursor = cursor[segment]
-            except Exception:
-                return default
-        return cursor
+        value = self._config_cache.get(path, _MISSING)
+        if value is _MISSING:
+            value = _lookup_config_path(self.config, path)
+            if value is _MISSING:
+                value = _lookup_config_path(_DEFAULT_CONFIG, path)
+            self._config_cache[path] = value
+        return default if value is _MISSING else value
 
     def msg(self, key: str, **kwargs: Any) -> str:
-        prefix = str(self.get_config("messages.prefix", "\u00a78[\u00a76Party\u00a78]\u00a7r "))
-        template = str(self.get_config(f"messages.{key}", key))
-        for param_name, param_value in kwargs.items():
-            template = template.replace("{" + param_name + "}", str(param_value))
-        return prefix + template
+        template = self._msg_templates.get(key)
+        if template is None:
+            template = compile_template(key)
+        return self._msg_prefix + render_template(template, kwargs)
 
     def _ensure_default_config(self) -> None:
         data_folder = Path(self.data_folder)
         data_folder.mkdir(parents=True, exist_ok=True)
         config_path = data_folder / "config.toml"
         if not config_path.exists():
-            config_path.write_text(DEFAULT_CONFIG_TOML + "\n", encoding="utf-8")
+            config_path.write_bytes(_DEFAULT_CONFIG_BYTES)
 
     def _start_autosave_task(self) -> None:
         self._cancel_autosave_task()
-        interval = int(self.get_config("performance.auto-save-interval", 6000))
+        interval = self._cfg.autosave_interval
         interval = max(20, interval)
         self._autosave_task = self.server.scheduler.run_task(self, self._run_periodic_maintenance, delay=interval, period=interval)
 
@@ -536,14 +732,21 @@ class EuphoriaPartiesPlugin(Plugin):
 
     def _run_periodic_maintenance(self) -> None:
         self.party_manager.cleanup_expired_invites()
-        online_ids = {player.unique_id for player in self.server.online_players}
-        self._last_friendly_fire_notice_ms = {
-            player_id: sent_at
-            for player_id, sent_at in self._last_friendly_fire_notice_ms.items()
-            if player_id in online_ids
-        }
+        self._prune_friendly_fire_notices()
         self.party_manager.save_all()
 
+    def _prune_friendly_fire_notices(self) -> None:
+        # Entries are already dropped on quit; this only guards against unbounded growth.
+        notices = self._last_friendly_fire_notice_ms
+        if len(notices) <= _FRIENDLY_FIRE_NOTICE_LIMIT:
+            return
+
+        cooldown_ms = max(0, self._cfg.ff_cooldown_ms)
+        cutoff = _monotonic_ms() - cooldown_ms
+        for player_id, sent_at in list(notices.items()):
+            if sent_at < cutoff:
+                del notices[player_id]
+
     def _start_update_check(self) -> None:
         if not bool(self.get_config("updates.enabled", True)):
             return
@@ -618,6 +821,9 @@ class EuphoriaPartiesPlugin(Plugin):
         raw = " ".join(args).strip()
         if not raw:
             return []
+        # Message-typed parameters arrive as one string with spaces, so re-split the joined payload.
+        if '"' not in raw and "'" not in raw and "\\" not in raw:
+            return raw.split()
         try:
             return shlex.split(raw)
         except ValueError:
@@ -626,7 +832,7 @@ class EuphoriaPartiesPlugin(Plugin):
     def _require_player_sender(self, sender: CommandSender) -> Player | None:
         if isinstance(sender, Player):
             return sender
-        sender.send_message("\u00a7cThis command can only be used by players!")
+        sender.send_message(MSG_PLAYER_ONLY)
         return None
 
     def _handle_party_command(self, sender: CommandSender, args: list[str]) -> bool:
@@ -640,73 +846,19 @@ class EuphoriaPartiesPlugin(Plugin):
             return True
 
         sub = tokens[0].lower()
-        rest = tokens[1:]
-
-        if sub == "create":
-            return self._party_create(player)
-        if sub == "invite":
-            return self._party_invite(player, rest)
-        if sub == "accept":
-            return self._party_accept(player)
-        if sub == "leave":
-            return self._party_leave(player)
-        if sub == "kick":
-            return self._party_kick(player, rest)
-        if sub == "promote":
-            return self._party_promote(player, rest)
-        if sub == "list":
-            return self._party_list(player)
-        if sub == "info":
-            return self._party_info(player)
-        if sub == "sethome":
-            return self._party_sethome(player)
-        if sub in {"home", "warp", "warpleader"}:
-            return self._party_home_or_warp(player, sub)
-        if sub == "name":
-            return self._party_name(player, rest)
-        if sub == "join":
-            return self._party_join(player, rest)
-        if sub == "requests":
-            return self._party_requests(player)
-        if sub in {"acceptrequest", "arequest"}:
-            return self._party_accept_request(player, rest)
-        if sub in {"denyrequest", "drequest"}:
-            return self._party_deny_request(player, rest)
-        if sub == "public":
-            return self._party_set_privacy(player, True)
-        if sub == "private":
-            return self._party_set_privacy(player, False)
-        if sub == "setrank":
-            return self._party_setrank(player, rest)
-        if sub == "ban":
-            return self._party_ban(player, rest)
-        if sub == "unban":
-            return self._party_unban(player, rest)
-        if sub == "color":
-            return self._party_color(player, rest)
-        if sub == "icon":
-            return self._party_icon(player, rest)
-        if sub == "ally":
-            return self._party_ally(player, rest)
-        if sub == "stats":
-            return self._party_stats(player)
-        if sub in {"daily", "dailyreward"}:
-            return self._party_daily(player)
-        if sub in {"scoreboard", "sb"}:
-            return self._party_scoreboard(player)
-        if sub == "show":
-            return self._party_show(player)
-        if sub in {"leaderboard", "lb", "top"}:
-            return self._party_leaderboard(player, rest)
-        if sub in {"achievements", "achievement"}:
-            return self._party_achievements(player)
+        handler_name = self._PARTY_SUBCOMMANDS_WITH_ARGS.get(sub)
+        if handler_name is not None:
+            return getattr(self, handler_name)(player, tokens[1:])
+        handler_name = self._PARTY_SUBCOMMANDS.get(sub)
+        if handler_name is not None:
+            return getattr(self, handler_name)(player)
 
         self._send_party_help(player)
         return True
 
     def _handle_party_admin_command(self, sender: CommandSender, args: list[str]) -> bool:
         if not sender.has_permission("euphoria.party.admin"):
-            sender.send_message("\u00a7cYou do not have permission to use this command.")
+            sender.send_message(MSG_NO_PERMISSION)
             return True
 
         tokens = self._parse_payload(args)
@@ -715,40 +867,32 @@ class EuphoriaPartiesPlugin(Plugin):
             return True
 
         sub = tokens[0].lower()
-        rest = tokens[1:]
-
-        if sub == "list":
-            return self._admin_list(sender)
-        if sub == "info":
-            return self._admin_info(sender, rest)
-        if sub == "disband":
-            return self._admin_disband(sender, rest)
-        if sub == "teleport":
-            return self._admin_teleport(sender, rest)
-        if sub == "reload":
-            return self._admin_reload(sender)
-        if sub == "health":
-            return self._admin_health(sender)
+        handler_name = self._ADMIN_SUBCOMMANDS_WITH_ARGS.get(sub)
+        if handler_name is not None:
+            return getattr(self, handler_name)(sender, tokens[1:])
+        handler_name = self._ADMIN_SUBCOMMANDS.get(sub)
+        if handler_name is not None:
+            return getattr(self, handler_name)(sender)
 
         self._send_party_admin_help(sender)
         return True
 
-    def _handle_coordinates_command(self, sender: CommandSender) -> bool:
+    def _handle_coordinates_command(self, sender: CommandSender, _args: list[str]) -> bool:
         player = self._require_player_sender(sender)
         if player is None:
             return True
         if not player.has_permission("euphoria.hud.coordinates"):
-            player.send_message("\u00a7cYou do not have permission to use this command.")
+            player.send_message(MSG_NO_PERMISSION)
             return True
         self.hud_manager.toggle_coordinates(player)
         return True
 
-    def _handle_compass_command(self, sender: CommandSender) -> bool:
+    def _handle_compass_command(self, sender: CommandSender, _args: list[str]) -> bool:
         player = self._require_player_sender(sender)
         if player is None:
             return True
         if not player.has_permission("euphoria.hud.compass"):
-            player.send_message("\u00a7cYou do not have permission to use this command.")
+            player.send_message(MSG_NO_PERMISSION)
             return True
         self.hud_manager.toggle_compass(player)
         return True
@@ -770,7 +914,7 @@ class EuphoriaPartiesPlugin(Plugin):
             player.send_message("\u00a7cYou do not have permission to invite players.")
             return True
         if not args:
-            player.send_message("\u00a7cUsage: /party invite <player>")
+            player.send_message(USAGE_INVITE)
             return True
 
         party = self.party_manager.get_player_party(player.unique_id)
@@ -786,9 +930,9 @@ class EuphoriaPartiesPlugin(Plugin):
             player.send_message(self.msg("command-cooldown", seconds=remaining))
             return True
 
-        target = self.server.get_player(args[0])
+        target = self.party_manager.find_online_player(args[0])
         if target is None:
-            player.send_message("\u00a7cPlayer not found or not online!")
+            player.send_message(MSG_PLAYER_NOT_FOUND)
             return True
         if target.unique_id == player.unique_id:
             player.send_message("\u00a7cYou cannot invite yourself.")
@@ -823,7 +967,7 @@ class EuphoriaPartiesPlugin(Plugin):
     def _party_accept(self, player: Player) -> bool:
         party = self.party_manager.get_pending_invite(player.unique_id)
         if party is None:
-            player.send_message("\u00a7cYou do not have any pending party invites!")
+            player.send_message(MSG_NO_INVITE)
             return True
         if self.party_manager.is_in_party(player.unique_id):
             player.send_message(self.msg("already-in-party"))
@@ -842,12 +986,14 @@ class EuphoriaPartiesPlugin(Plugin):
             player.send_message(self.msg("not-in-party"))
             return True
 
-        for member_id in party.members:
+        left_message = self.msg("player-left", player=player.name)
+        online_players = self.party_manager.online_players
+        for member_id in party.member_snapshot:
             if member_id == player.unique_id:
                 continue
-            member = self.server.get_player(member_id)
+            member = online_players.get(member_id)
             if member is not None:
-                member.send_message(self.msg("player-left", player=player.name))
+                member.send_message(left_message)
 
         _, new_leader = self.party_manager.leave_party(player.unique_id)
         player.send_message(self.msg("player-left", player="You"))
@@ -865,7 +1011,7 @@ class EuphoriaPartiesPlugin(Plugin):
             player.send_message("\u00a7cYou do not have permission to kick players.")
             return True
         if not args:
-            player.send_message("\u00a7cUsage: /party kick <player>")
+            player.send_message(USAGE_KICK)
             return True
 
         party = self.party_manager.get_player_party(player.unique_id)
@@ -878,7 +1024,7 @@ class EuphoriaPartiesPlugin(Plugin):
 
         target_id = self._find_member_id_by_name(party, args[0])
         if target_id is None:
-            player.send_message("\u00a7cThat player is not in your party.")
+            player.send_message(MSG_NOT_IN_YOUR_PARTY)
             return True
         if party.is_leader(target_id):
             player.send_message("\u00a7cYou cannot kick the party leader.")
@@ -898,7 +1044,7 @@ class EuphoriaPartiesPlugin(Plugin):
             player.send_message("\u00a7cYou do not have permission to promote players.")
             return True
         if not args:
-            player.send_message("\u00a7cUsage: /party promote <player>")
+            player.send_message(USAGE_PROMOTE)
             return True
 
         party = self.party_manager.get_player_party(player.unique_id)
@@ -911,55 +1057,50 @@ class EuphoriaPartiesPlugin(Plugin):
 
         target_id = self._find_member_id_by_name(party, args[0])
         if target_id is None:
-            player.send_message("\u00a7cThat player is not in your party.")
+            player.send_message(MSG_NOT_IN_YOUR_PARTY)
             return True
         if party.is_leader(target_id):
             player.send_message("\u00a7cThat player is already leader.")
             return True
 
         party.transfer_leadership(target_id)
-        self.party_manager.mark_dirty()
+        self.party_manager.mark_dirty(party.id)
         target_name = self.party_manager.get_player_name(target_id)
         self.party_manager.broadcast_to_party(party, self.msg("leader-transferred", player=target_name))
         return True
 
-    def _party_list(self, player: Player) -> bool:
-        party = self.party_manager.get_player_party(player.unique_id)
-        if party is None:
-            player.send_message(self.msg("not-in-party"))
-            return True
-
-        player.send_message("\u00a78[\u00a76Party Members\u00a78]")
-        for member_id in sorted(party.members, key=lambda entry: self.party_manager.get_player_name(entry).lower()):
+    @_requires_party
+    def _party_list(self, player: Player, party: Party) -> bool:
+        online_players = self.party_manager.online_players
+        lines = [HEADER_PARTY_MEMBERS]
+        for member_id in sorted(party.members, key=self.party_manager.get_player_name_lower):
             member_name = self.party_manager.get_player_name(member_id)
-            online = self.server.get_player(member_id) is not None
+            online = member_id in online_players
             status = "\u00a7a*" if online else "\u00a7c*"
             role = "Leader" if party.is_leader(member_id) else "Member"
-            player.send_message(f"{status} \u00a7f{member_name} \u00a78[\u00a7e{role}\u00a78]")
+            lines.append(f"{status} \u00a7f{member_name} \u00a78[\u00a7e{role}\u00a78]")
+        player.send_message("\n".join(lines))
         return True
 
-    def _party_info(self, player: Player) -> bool:
-        party = self.party_manager.get_player_party(player.unique_id)
-        if party is None:
-            player.send_message(self.msg("not-in-party"))
-            return True
-
+    @_requires_party
+    def _party_info(self, player: Player, party: Party) -> bool:
         leader_name = self.party_manager.get_player_name(party.leader)
         online_count = self.party_manager.online_party_member_count(party)
-        age_minutes = max(0, (int(datetime.now().timestamp() * 1000) - party.created_at) // 60000)
+        age_minutes = max(0, (now_ms() - party.created_at) // 60000)
         age_hours = age_minutes // 60
 
-        player.send_message("\u00a78========== \u00a76Party Info \u00a78==========")
-        player.send_message(f"\u00a7eLeader: \u00a7f{leader_name}")
-        player.send_message(f"\u00a7eMembers: \u00a7f{online_count}\u00a77/\u00a7f{len(party.members)}")
-        player.send_message(f"\u00a7ePending Invites: \u00a7f{len(party.invites)}")
+        lines = [HEADER_PARTY_INFO]
+        lines.append(f"\u00a7eLeader: \u00a7f{leader_name}")
+        lines.append(f"\u00a7eMembers: \u00a7f{online_count}\u00a77/\u00a7f{len(party.members)}")
+        lines.append(f"\u00a7ePending Invites: \u00a7f{len(party.invites)}")
         home_status = "\u00a7aYes" if party.has_home() else "\u00a7cNo"
-        player.send_message(f"\u00a7eParty Home: {home_status}")
+        lines.append(f"\u00a7eParty Home: {home_status}")
         if age_hours > 0:
-            player.send_message(f"\u00a7eAge: \u00a7f{age_hours}h {age_minutes % 60}m")
+            lines.append(f"\u00a7eAge: \u00a7f{age_hours}h {age_minutes % 60}m")
         else:
-            player.send_message(f"\u00a7eAge: \u00a7f{age_minutes}m")
-        player.send_message("\u00a78================================")
+            lines.append(f"\u00a7eAge: \u00a7f{age_minutes}m")
+        lines.append(MSG_FOOTER)
+        player.send_message("\n".join(lines))
         return True
 
     def _party_sethome(self, player: Player) -> bool:
@@ -979,12 +1120,8 @@ class EuphoriaPartiesPlugin(Plugin):
         player.send_message(self.msg("home-set"))
         return True
 
-    def _party_home_or_warp(self, player: Player, subcommand: str) -> bool:
-        party = self.party_manager.get_player_party(player.unique_id)
-        if party is None:
-            player.send_message(self.msg("not-in-party"))
-            return True
-
+    @_requires_party
+    def _party_home_or_warp(self, player: Player, party: Party, subcommand: str) -> bool:
         if self.party_manager.is_on_teleport_cooldown(player.unique_id):
             remaining = self.party_manager.remaining_teleport_cooldown(player.unique_id)
             player.send_message(self.msg("teleport-cooldown", seconds=remaining))
@@ -998,52 +1135,43 @@ class EuphoriaPartiesPlugin(Plugin):
         player.send_message(self.msg(key))
         return True
 
-    def _party_name(self, player: Player, args: list[str]) -> bool:
-        party = self.party_manager.get_player_party(player.unique_id)
-        if party is None:
-            player.send_message(self.msg("not-in-party"))
-            return True
-        if not party.is_leader(player.unique_id):
-            player.send_message(self.msg("not-party-leader"))
-            return True
-
-        party_name = " ".join(args).strip()
-        if not party_name:
-            player.send_message("\u00a7cUsage: /party name <name>")
-            return True
+    def _party_home(self, player: Player) -> bool:
+        return self._party_home_or_warp(player, "home")
 
-        # Fallback for rare cases where the command parser includes wrapping quotes.
-        if len(party_name) >= 2 and (
-            (party_name.startswith('"') and party_name.endswith('"'))
-            or (party_name.startswith("'") and party_name.endswith("'"))
-        ):
-            party_name = party_name[1:-1].strip()
+    def _party_warp(self, player: Player) -> bool:
+        return self._party_home_or_warp(player, "warp")
 
+    @_requires_leader
+    def _party_name(self, player: Player, party: Party, args: list[str]) -> bool:
+        party_name = _parse_quoted_name(args)
+        if party_name is None:
+            player.send_message(USAGE_NAME)
+            return True
         if not party_name or len(party_name) > 24:
             player.send_message("\u00a7cParty name must be 1-24 characters.")
             return True
 
         party.name = party_name
-        self.party_manager.mark_dirty()
+        self.party_manager.mark_dirty(party.id)
         self.party_manager.broadcast_to_party(party, self.msg("party-name-set", name=party_name))
         return True
 
     def _party_join(self, player: Player, args: list[str]) -> bool:
         if not args:
-            player.send_message("\u00a7cUsage: /party join <player>")
+            player.send_message(USAGE_JOIN)
             return True
         if self.party_manager.is_in_party(player.unique_id):
             player.send_message(self.msg("already-in-party"))
             return True
 
-        target = self.server.get_player(args[0])
+        target = self.party_manager.find_online_player(args[0])
         if target is None:
-            player.send_message("\u00a7cPlayer not found or not online!")
+            player.send_message(MSG_PLAYER_NOT_FOUND)
             return True
 
         target_party = self.party_manager.get_player_party(target.unique_id)
         if target_party is None:
-            player.send_message("\u00a7cThat player is not in a party.")
+            player.send_message(MSG_TARGET_NOT_IN_PARTY)
             return True
         if player.unique_id in target_party.banned_players:
             player.send_message("\u00a7cYou are banned from that party.")
@@ -1067,29 +1195,23 @@ class EuphoriaPartiesPlugin(Plugin):
             leader.send_message(f"\u00a7e{player.name} requested to join your party. Use /party requests")
         return True
 
-    def _party_requests(self, player: Player) -> bool:
-        party = self.party_manager.get_player_party(player.unique_id)
-        if party is None:
-            player.send_message(self.msg("not-in-party"))
-            return True
-        if not party.is_leader(player.unique_id):
-            player.send_message(self.msg("not-party-leader"))
-            return True
-
+    @_requires_leader
+    def _party_requests(self, player: Player, party: Party) -> bool:
         if not party.join_requests:
             player.send_message("\u00a77No pending join requests.")
             return True
 
-        player.send_message("\u00a78========== \u00a76Join Requests \u00a78==========")
-        for requester_id in sorted(party.join_requests, key=lambda entry: self.party_manager.get_player_name(entry).lower()):
-            player.send_message(f"\u00a77- \u00a7f{self.party_manager.get_player_name(requester_id)}")
-        player.send_message("\u00a77Use /party acceptrequest <player> or /party denyrequest <player>")
-        player.send_message("\u00a78================================")
+        lines = [HEADER_JOIN_REQUESTS]
+        for requester_id in sorted(party.join_requests, key=self.party_manager.get_player_name_lower):
+            lines.append(f"\u00a77- \u00a7f{self.party_manager.get_player_name(requester_id)}")
+        lines.append("\u00a77Use /party acceptrequest <player> or /party denyrequest <player>")
+        lines.append(MSG_FOOTER)
+        player.send_message("\n".join(lines))
         return True
 
     def _party_accept_request(self, player: Player, args: list[str]) -> bool:
         if not args:
-            player.send_message("\u00a7cUsage: /party acceptrequest <player>")
+            player.send_message(USAGE_ACCEPTREQUEST)
             return True
 
         party = self.party_manager.get_player_party(player.unique_id)
@@ -1102,13 +1224,13 @@ class EuphoriaPartiesPlugin(Plugin):
 
         requester_id = self._find_requester_id(party, args[0])
         if requester_id is None:
-            player.send_message("\u00a7cNo matching join request found.")
+            player.send_message(MSG_NO_JOIN_REQUEST)
             return True
 
         requester = self.server.get_player(requester_id)
         if requester is None:
             party.remove_join_request(requester_id)
-            self.party_manager.mark_dirty()
+            self.party_manager.mark_dirty(party.id)
             player.send_message("\u00a7cThat player is no longer online.")
             return True
 
@@ -1123,7 +1245,7 @@ class EuphoriaPartiesPlugin(Plugin):
 
     def _party_deny_request(self, player: Player, args: list[str]) -> bool:
         if not args:
-            player.send_message("\u00a7cUsage: /party denyrequest <player>")
+            player.send_message(USAGE_DENYREQUEST)
             return True
 
         party = self.party_manager.get_player_party(player.unique_id)
@@ -1136,7 +1258,7 @@ class EuphoriaPartiesPlugin(Plugin):
 
         requester_id = self._find_requester_id(party, args[0])
         if requester_id is None:
-            player.send_message("\u00a7cNo matching join request found.")
+            player.send_message(MSG_NO_JOIN_REQUEST)
             return True
 
         self.party_manager.deny_join_request(party, requester_id)
@@ -1146,27 +1268,26 @@ class EuphoriaPartiesPlugin(Plugin):
             requester.send_message("\u00a7cYour join request was denied.")
         return True
 
-    def _party_set_privacy(self, player: Player, is_public: bool) -> bool:
-        party = self.party_manager.get_player_party(player.unique_id)
-        if party is None:
-            player.send_message(self.msg("not-in-party"))
-            return True
-        if not party.is_leader(player.unique_id):
-            player.send_message(self.msg("not-party-leader"))
-            return True
-
+    @_requires_leader
+    def _party_set_privacy(self, player: Player, party: Party, is_public: bool) -> bool:
         party.is_public = is_public
-        self.party_manager.mark_dirty()
+        self.party_manager.mark_dirty(party.id)
         player.send_message("\u00a7aParty is now public." if is_public else "\u00a7aParty is now private.")
         return True
 
+    def _party_public(self, player: Player) -> bool:
+        return self._party_set_privacy(player, True)
+
+    def _party_private(self, player: Player) -> bool:
+        return self._party_set_privacy(player, False)
+
     def _party_setrank(self, player: Player, args: list[str]) -> bool:
         if not player.has_permission("euphoria.party.promote"):
             player.send_message("\u00a7cYou do not have permission to set ranks.")
             return True
 
         if len(args) < 2:
-            player.send_message("\u00a7cUsage: /party setrank <player> <officer|member|recruit>")
+            player.send_message(USAGE_SETRANK)
             return True
 
         party = self.party_manager.get_player_party(player.unique_id)
@@ -1179,25 +1300,20 @@ class EuphoriaPartiesPlugin(Plugin):
 
         target_id = self._find_member_id_by_name(party, args[0])
         if target_id is None:
-            player.send_message("\u00a7cThat player is not in your party.")
+            player.send_message(MSG_NOT_IN_YOUR_PARTY)
             return True
         if target_id == party.leader:
             player.send_message("\u00a7cUse /party promote to transfer leadership.")
             return True
 
         role_name = args[1].strip().lower()
-        role_lookup = {
-            "officer": PartyRole.OFFICER,
-            "member": PartyRole.MEMBER,
-            "recruit": PartyRole.RECRUIT,
-        }
-        role = role_lookup.get(role_name)
+        role = _ASSIGNABLE_ROLES.get(role_name)
         if role is None:
             player.send_message("\u00a7cValid ranks: officer, member, recruit")
             return True
 
         party.set_role(target_id, role)
-        self.party_manager.mark_dirty()
+        self.party_manager.mark_dirty(party.id)
         target_name = self.party_manager.get_player_name(target_id)
         player.send_message(f"\u00a7aSet {target_name}'s rank to \u00a7e{role.value}\u00a7a.")
 
@@ -1208,7 +1324,7 @@ class EuphoriaPartiesPlugin(Plugin):
 
     def _party_ban(self, player: Player, args: list[str]) -> bool:
         if len(args) < 1:
-            player.send_message("\u00a7cUsage: /party ban <player>")
+            player.send_message(USAGE_BAN)
             return True
 
         party = self.party_manager.get_player_party(player.unique_id)
@@ -1221,7 +1337,7 @@ class EuphoriaPartiesPlugin(Plugin):
 
         target_id = self._find_member_id_by_name(party, args[0])
         if target_id is None:
-            player.send_message("\u00a7cThat player is not in your party.")
+            player.send_message(MSG_NOT_IN_YOUR_PARTY)
             return True
         if target_id == party.leader:
             player.send_message("\u00a7cYou cannot ban the party leader.")
@@ -1231,10 +1347,8 @@ class EuphoriaPartiesPlugin(Plugin):
             return True
 
         target_name = self.party_manager.get_player_name(target_id)
-        party.ban_player(target_id)
-        self.party_manager.player_to_party.pop(target_id, None)
-        self.party_manager.mark_dirty()
-        self.party_manager.broadcast_to_party(party, f"\u00a7c{target_name} was banned from the party!")
+        self.party_manager.ban_player(party, target_id)
+        self.party_manager.broadcast_to_party(party, FMT_PLAYER_BANNED.format(target_name))
 
         target = self.server.get_player(target_id)
         if target is not None:
@@ -1243,7 +1357,7 @@ class EuphoriaPartiesPlugin(Plugin):
 
     def _party_unban(self, player: Player, args: list[str]) -> bool:
         if len(args) < 1:
-            player.send_message("\u00a7cUsage: /party unban <player>")
+            player.send_message(USAGE_UNBAN)
             return True
 
         party = self.party_manager.get_player_party(player.unique_id)
@@ -1261,13 +1375,13 @@ class EuphoriaPartiesPlugin(Plugin):
 
         target_name = self.party_manager.get_player_name(target_id)
         party.unban_player(target_id)
-        self.party_manager.mark_dirty()
-        player.send_message(f"\u00a7aUnbanned {target_name} from the party.")
+        self.party_manager.mark_dirty(party.id)
+        player.send_message(FMT_PLAYER_UNBANNED.format(target_name))
         return True
 
     def _party_color(self, player: Player, args: list[str]) -> bool:
         if len(args) < 1:
-            player.send_message("\u00a7cUsage: /party color <color>")
+            player.send_message(USAGE_COLOR)
             player.send_message("\u00a77Valid colors: gold, yellow, green, aqua, red, purple, white, gray, blue")
             return True
 
@@ -1279,32 +1393,20 @@ class EuphoriaPartiesPlugin(Plugin):
             player.send_message(self.msg("not-party-leader"))
             return True
 
-        color_lookup = {
-            "gold": "\u00a76",
-            "yellow": "\u00a7e",
-            "green": "\u00a7a",
-            "aqua": "\u00a7b",
-            "red": "\u00a7c",
-            "purple": "\u00a75",
-            "white": "\u00a7f",
-            "gray": "\u00a77",
-            "blue": "\u00a79",
-            "dark_green": "\u00a72",
-        }
         color_name = args[0].strip().lower()
-        color_code = color_lookup.get(color_name)
+        color_code = _COLOR_CODES.get(color_name)
         if color_code is None:
             player.send_message("\u00a7cInvalid color.")
             return True
 
         party.color = color_code
-        self.party_manager.mark_dirty()
+        self.party_manager.mark_dirty(party.id)
         self.party_manager.broadcast_to_party(party, f"\u00a7eParty color changed to {color_code}{color_name}\u00a7e!")
         return True
 
     def _party_icon(self, player: Player, args: list[str]) -> bool:
         if len(args) < 1:
-            player.send_message("\u00a7cUsage: /party icon <icon>")
+            player.send_message(USAGE_ICON)
             return True
 
         party = self.party_manager.get_player_party(player.unique_id)
@@ -1321,13 +1423,13 @@ class EuphoriaPartiesPlugin(Plugin):
             return True
 
         party.icon = icon
-        self.party_manager.mark_dirty()
+        self.party_manager.mark_dirty(party.id)
         self.party_manager.broadcast_to_party(party, f"\u00a7eParty icon changed to {party.color}{icon}\u00a7e!")
         return True
 
     def _party_ally(self, player: Player, args: list[str]) -> bool:
         if len(args) < 1:
-            player.send_message("\u00a7cUsage: /party ally <add|remove|list> [player]")
+            player.send_message(USAGE_ALLY)
             return True
 
         party = self.party_manager.get_player_party(player.unique_id)
@@ -1340,29 +1442,30 @@ class EuphoriaPartiesPlugin(Plugin):
 
         action = args[0].strip().lower()
         if action == "list":
-            player.send_message("\u00a78========== \u00a76Party Allies \u00a78==========")
-            if not party.allies:
-                player.send_message("\u00a77No allies yet.")
+            lines = [HEADER_PARTY_ALLIES]
+            ally_parties = [ally for ally in map(self.party_manager.get_party, party.allies) if ally is not None]
+            if not ally_parties:
+                lines.append("\u00a77No allies yet.")
             else:
-                for ally_id in sorted(party.allies, key=lambda value: str(value)):
-                    ally_party = self.party_manager.get_party(ally_id)
-                    if ally_party is not None:
-                        player.send_message(f"\u00a77- \u00a7f{self._party_display_name(ally_party)}")
-            player.send_message("\u00a78================================")
+                ally_parties.sort(key=lambda ally: ((ally.name or "").lower(), ally.id))
+                for ally_party in ally_parties:
+                    lines.append(f"\u00a77- \u00a7f{self._party_display_name(ally_party)}")
+            lines.append(MSG_FOOTER)
+            player.send_message("\n".join(lines))
             return True
 
         if len(args) < 2:
             player.send_message(f"\u00a7cUsage: /party ally {action} <player>")
             return True
 
-        target = self.server.get_player(args[1])
+        target = self.party_manager.find_online_player(args[1])
         if target is None:
-            player.send_message("\u00a7cPlayer not found or not online!")
+            player.send_message(MSG_PLAYER_NOT_FOUND)
             return True
 
         target_party = self.party_manager.get_player_party(target.unique_id)
         if target_party is None:
-            player.send_message("\u00a7cThat player is not in a party.")
+            player.send_message(MSG_TARGET_NOT_IN_PARTY)
             return True
         if target_party.id == party.id:
             player.send_message("\u00a7cYou cannot ally with your own party.")
@@ -1371,64 +1474,48 @@ class EuphoriaPartiesPlugin(Plugin):
         if action == "add":
             party.allies.add(target_party.id)
             target_party.allies.add(party.id)
-            self.party_manager.mark_dirty()
-            self.party_manager.broadcast_to_party(
-                party, f"\u00a7aFormed alliance with {self._party_display_name(target_party)}\u00a7a!"
-            )
-            self.party_manager.broadcast_to_party(
-                target_party, f"\u00a7aFormed alliance with {self._party_display_name(party)}\u00a7a!"
-            )
+            self.party_manager.mark_dirty(party.id, target_party.id)
+            self.party_manager.broadcast_to_party(party, FMT_ALLY_FORMED.format(self._party_display_name(target_party)))
+            self.party_manager.broadcast_to_party(target_party, FMT_ALLY_FORMED.format(self._party_display_name(party)))
             return True
 
         if action == "remove":
             party.allies.discard(target_party.id)
             target_party.allies.discard(party.id)
-            self.party_manager.mark_dirty()
-            self.party_manager.broadcast_to_party(
-                party, f"\u00a7cRemoved alliance with {self._party_display_name(target_party)}\u00a7c."
-            )
-            self.party_manager.broadcast_to_party(
-                target_party, f"\u00a7cRemoved alliance with {self._party_display_name(party)}\u00a7c."
-            )
+            self.party_manager.mark_dirty(party.id, target_party.id)
+            self.party_manager.broadcast_to_party(party, FMT_ALLY_REMOVED.format(self._party_display_name(target_party)))
+            self.party_manager.broadcast_to_party(target_party, FMT_ALLY_REMOVED.format(self._party_display_name(party)))
             return True
 
-        player.send_message("\u00a7cUsage: /party ally <add|remove|list> [player]")
+        player.send_message(USAGE_ALLY)
         return True
 
-    def _party_stats(self, player: Player) -> bool:
-        party = self.party_manager.get_player_party(player.unique_id)
-        if party is None:
-            player.send_message(self.msg("not-in-party"))
-            return True
-
+    @_requires_party
+    def _party_stats(self, player: Player, party: Party) -> bool:
         total_minutes = party.total_play_time_ms // 60000
         hours = total_minutes // 60
         minutes = total_minutes % 60
 
-        player.send_message("\u00a78========== \u00a76Party Statistics \u00a78==========")
+        lines = [HEADER_PARTY_STATS]
         if party.name:
-            player.send_message(f"\u00a7eParty: \u00a7f{party.name}")
-        player.send_message(f"\u00a7eTotal Play Time: \u00a7f{hours}h {minutes}m")
-        player.send_message(f"\u00a7eTotal Kills: \u00a7f{party.total_kills}")
-        player.send_message(f"\u00a7eTotal Deaths: \u00a7f{party.total_deaths}")
+            lines.append(f"\u00a7eParty: \u00a7f{party.name}")
+        lines.append(f"\u00a7eTotal Play Time: \u00a7f{hours}h {minutes}m")
+        lines.append(f"\u00a7eTotal Kills: \u00a7f{party.total_kills}")
+        lines.append(f"\u00a7eTotal Deaths: \u00a7f{party.total_deaths}")
         if party.total_deaths > 0:
-            kd = party.total_kills / party.total_deaths
-            player.send_message(f"\u00a7eK/D Ratio: \u00a7f{kd:.2f}")
-        player.send_message("\u00a78================================")
+            lines.append(f"\u00a7eK/D Ratio: \u00a7f{party.kd_ratio:.2f}")
+        lines.append(MSG_FOOTER)
+        player.send_message("\n".join(lines))
         return True
 
-    def _party_daily(self, player: Player) -> bool:
-        party = self.party_manager.get_player_party(player.unique_id)
-        if party is None:
-            player.send_message(self.msg("not-in-party"))
-            return True
-
+    @_requires_party
+    def _party_daily(self, player: Player, party: Party) -> bool:
         if not party.can_claim_daily_reward(player.unique_id):
             player.send_message("\u00a7cYou have already claimed your daily reward today!")
             return True
 
         party.claim_daily_reward(player.unique_id)
-        self.party_manager.mark_dirty()
+        self.party_manager.mark_dirty(party.id)
 
         base_xp = int(self.get_config("party.daily-reward-xp", 50))
         streak_bonus = int(self.get_config("party.daily-reward-streak-bonus", 10))
@@ -1436,7 +1523,7 @@ class EuphoriaPartiesPlugin(Plugin):
         total_xp = base_xp + bonus
 
         player.give_exp(total_xp)
-        player.send_message("\u00a78[\u00a76Party\u00a78] \u00a7aDaily Reward Claimed!")
+        player.send_message(CHAT_PREFIX + "\u00a7aDaily Reward Claimed!")
         player.send_message(f"\u00a7e+{total_xp} XP \u00a77(Day {party.consecutive_days} Streak)")
 
         if party.consecutive_days % 7 == 0:
@@ -1460,60 +1547,58 @@ class EuphoriaPartiesPlugin(Plugin):
         if metric in {"kills", "kill"}:
             top_parties = self.leaderboard_manager.top_by_kills(10)
             title = "Top Parties by Kills"
-            value_for = lambda party: f"{party.total_kills} kills"
+            value_format = "{} kills"
         elif metric in {"playtime", "time"}:
             top_parties = self.leaderboard_manager.top_by_playtime(10)
             title = "Top Parties by Playtime"
-            value_for = lambda party: f"{party.total_play_time_ms // (1000 * 60 * 60)} hours"
+            value_format = "{} hours"
         elif metric in {"members", "size"}:
             top_parties = self.leaderboard_manager.top_by_members(10)
             title = "Top Parties by Members"
-            value_for = lambda party: f"{len(party.members)} members"
+            value_format = "{} members"
         elif metric in {"kd", "ratio"}:
             top_parties = self.leaderboard_manager.top_by_kd(10)
             title = "Top Parties by K/D"
-            value_for = lambda party: (
-                f"{(party.total_kills / party.total_deaths if party.total_deaths > 0 else float(party.total_kills)):.2f} K/D"
-            )
+            value_format = "{:.2f} K/D"
         elif metric in {"achievements", "achieve"}:
             top_parties = self.leaderboard_manager.top_by_achievements(10)
             title = "Top Parties by Achievements"
-            value_for = lambda party: f"{len(party.achievements)} achievements"
+            value_format = "{} achievements"
         else:
-            player.send_message("\u00a7cUsage: /party leaderboard <kills|playtime|members|kd|achievements>")
+            player.send_message(USAGE_LEADERBOARD)
             return True
 
-        player.send_message("\u00a78========== \u00a76Party Leaderboard \u00a78==========")
-        player.send_message(f"\u00a7e{title}")
-        for index, party in enumerate(top_parties, start=1):
-            player.send_message(f"\u00a77#{index} \u00a7f{self._party_display_name(party)} \u00a77- \u00a7e{value_for(party)}")
-        player.send_message("\u00a78================================")
+        lines = [HEADER_LEADERBOARD]
+        lines.append(f"\u00a7e{title}")
+        for index, (party, value) in enumerate(top_parties, start=1):
+            lines.append(
+                f"\u00a77#{index} \u00a7f{self._party_display_name(party)} \u00a77- \u00a7e{value_format.format(value)}"
+            )
+        lines.append(MSG_FOOTER)
+        player.send_message("\n".join(lines))
         return True
 
-    def _party_achievements(self, player: Player) -> bool:
-        party = self.party_manager.get_player_party(player.unique_id)
-        if party is None:
-            player.send_message(self.msg("not-in-party"))
-            return True
-
+    @_requires_party
+    def _party_achievements(self, player: Player, party: Party) -> bool:
         all_achievements = self.achievement_manager.get_all()
         if not all_achievements:
             player.send_message("\u00a7cNo achievements are currently registered.")
             return True
 
         unlocked = 0
-        player.send_message("\u00a78========== \u00a76Party Achievements \u00a78==========")
+        lines = [HEADER_ACHIEVEMENTS]
         for achievement in all_achievements:
             has_achievement = party.has_achievement(achievement.id)
             marker = "\u00a7a+" if has_achievement else "\u00a7c-"
             style = "\u00a7f" if has_achievement else "\u00a78"
-            player.send_message(f"{marker} {style}{achievement.name}")
+            lines.append(f"{marker} {style}{achievement.name}")
             if achievement.description:
-                player.send_message(f"  \u00a77{achievement.description}")
+                lines.append(f"  \u00a77{achievement.description}")
             if has_achievement:
                 unlocked += 1
-        player.send_message(f"\u00a7eUnlocked: \u00a7f{unlocked}\u00a77/\u00a7f{len(all_achievements)}")
-        player.send_message("\u00a78================================")
+        lines.append(f"\u00a7eUnlocked: \u00a7f{unlocked}\u00a77/\u00a7f{len(all_achievements)}")
+        lines.append(MSG_FOOTER)
+        player.send_message("\n".join(lines))
         return True
 
     def _admin_list(self, sender: CommandSender) -> bool:
@@ -1521,71 +1606,74 @@ class EuphoriaPartiesPlugin(Plugin):
             sender.send_message("\u00a7eThere are currently no active parties.")
             return True
 
-        sender.send_message("\u00a78========== \u00a76Active Parties \u00a78==========")
-        sender.send_message(f"\u00a7eTotal parties: \u00a7f{len(self.party_manager.parties)}")
+        lines = [HEADER_ACTIVE_PARTIES]
+        lines.append(f"\u00a7eTotal parties: \u00a7f{len(self.party_manager.parties)}")
 
-        for index, party in enumerate(self.party_manager.all_parties(), start=1):
+        for index, party in enumerate(self.party_manager.parties.values(), start=1):
             leader_name = self.party_manager.get_player_name(party.leader)
             online_count = self.party_manager.online_party_member_count(party)
             home_status = "\u00a7aYes" if party.has_home() else "\u00a7cNo"
-            sender.send_message(
+            lines.append(
                 f"\u00a77{index}. \u00a7fLeader: \u00a7e{leader_name} "
                 f"\u00a77| \u00a7fMembers: \u00a7e{online_count}\u00a77/\u00a7e{len(party.members)} "
                 f"\u00a77| \u00a7fHome: {home_status}"
             )
 
-        sender.send_message("\u00a78================================")
+        lines.append(MSG_FOOTER)
+        sender.send_message("\n".join(lines))
         return True
 
     def _admin_info(self, sender: CommandSender, args: list[str]) -> bool:
         if not args:
-            sender.send_message("\u00a7cUsage: /partyadmin info <player>")
+            sender.send_message(USAGE_ADMIN_INFO)
             return True
 
-        target = self.server.get_player(args[0])
+        target = self.party_manager.find_online_player(args[0])
         if target is None:
-            sender.send_message("\u00a7cPlayer not found or not online!")
+            sender.send_message(MSG_PLAYER_NOT_FOUND)
             return True
 
         party = self.party_manager.get_player_party(target.unique_id)
         if party is None:
-            sender.send_message(f"\u00a7c{target.name} is not in a party.")
+            sender.send_message(FMT_NOT_IN_A_PARTY.format(target.name))
             return True
 
-        sender.send_message("\u00a78========== \u00a76Party Info \u00a78==========")
-        sender.send_message(f"\u00a7eParty ID: \u00a7f{party.id}")
-        sender.send_message(f"\u00a7eLeader: \u00a7f{self.party_manager.get_player_name(party.leader)}")
-        sender.send_message(f"\u00a7eMembers (\u00a7f{len(party.members)}\u00a7e):")
-        for member_id in sorted(party.members, key=lambda entry: self.party_manager.get_player_name(entry).lower()):
+        lines = [HEADER_PARTY_INFO]
+        lines.append(f"\u00a7eParty ID: \u00a7f{party.id}")
+        lines.append(f"\u00a7eLeader: \u00a7f{self.party_manager.get_player_name(party.leader)}")
+        lines.append(f"\u00a7eMembers (\u00a7f{len(party.members)}\u00a7e):")
+        online_players = self.party_manager.online_players
+        for member_id in sorted(party.members, key=self.party_manager.get_player_name_lower):
             member_name = self.party_manager.get_player_name(member_id)
-            online = self.server.get_player(member_id) is not None
+            online = member_id in online_players
             status = "\u00a7a*" if online else "\u00a7c*"
             role = party.get_role(member_id).value.capitalize()
-            sender.send_message(f"  {status} \u00a7f{member_name} \u00a78[\u00a7e{role}\u00a78]")
+            lines.append(f"  {status} \u00a7f{member_name} \u00a78[\u00a7e{role}\u00a78]")
 
         home = self.party_manager.get_party_home_location(party)
         if home is not None:
-            sender.send_message(
+            lines.append(
                 f"\u00a7eParty Home: \u00a7f{home.dimension.name} ({int(home.x)}, {int(home.y)}, {int(home.z)})"
             )
         else:
-            sender.send_message("\u00a7eParty Home: \u00a7cNot set")
-        sender.send_message("\u00a78================================")
+            lines.append("\u00a7eParty Home: \u00a7cNot set")
+        lines.append(MSG_FOOTER)
+        sender.send_message("\n".join(lines))
         return True
 
     def _admin_disband(self, sender: CommandSender, args: list[str]) -> bool:
         if not args:
-            sender.send_message("\u00a7cUsage: /partyadmin disband <player>")
+            sender.send_message(USAGE_ADMIN_DISBAND)
             return True
 
-        target = self.server.get_player(args[0])
+        target = self.party_manager.find_online_player(args[0])
         if target is None:
-            sender.send_message("\u00a7cPlayer not found or not online!")
+            sender.send_message(MSG_PLAYER_NOT_FOUND)
             return True
 
         party = self.party_manager.get_player_party(target.unique_id)
         if party is None:
-            sender.send_message(f"\u00a7c{target.name} is not in a party.")
+            sender.send_message(FMT_NOT_IN_A_PARTY.format(target.name))
             return True
 
         self.party_manager.broadcast_to_party(party, "\u00a7cYour party was disbanded by an administrator.")
@@ -1598,17 +1686,17 @@ class EuphoriaPartiesPlugin(Plugin):
         if player is None:
             return True
         if not args:
-            sender.send_message("\u00a7cUsage: /partyadmin teleport <player>")
+            sender.send_message(USAGE_ADMIN_TELEPORT)
             return True
 
-        target = self.server.get_player(args[0])
+        target = self.party_manager.find_online_player(args[0])
         if target is None:
-            sender.send_message("\u00a7cPlayer not found or not online!")
+            sender.send_message(MSG_PLAYER_NOT_FOUND)
             return True
 
         party = self.party_manager.get_player_party(target.unique_id)
         if party is None:
-            sender.send_message(f"\u00a7c{target.name} is not in a party.")
+            sender.send_message(FMT_NOT_IN_A_PARTY.format(target.name))
             return True
 
         home = self.party_manager.get_party_home_location(party)
@@ -1631,59 +1719,28 @@ class EuphoriaPartiesPlugin(Plugin):
         return True
 
     def _admin_health(self, sender: CommandSender) -> bool:
-        sender.send_message("\u00a78========== \u00a76Plugin Health \u00a78==========")
-        sender.send_message(f"\u00a7eActive Parties: \u00a7f{len(self.party_manager.parties)}")
-        sender.send_message(f"\u00a7eOnline Players: \u00a7f{len(self.server.online_players)}")
-        sender.send_message(f"\u00a7eCurrent TPS: \u00a7f{self.server.current_tps:.2f}")
-        sender.send_message(f"\u00a7eAverage TPS: \u00a7f{self.server.average_tps:.2f}")
-        sender.send_message(f"\u00a7eCurrent MSPT: \u00a7f{self.server.current_mspt:.2f}")
-        sender.send_message(f"\u00a7eAverage MSPT: \u00a7f{self.server.average_mspt:.2f}")
+        lines = [HEADER_PLUGIN_HEALTH]
+        lines.append(f"\u00a7eActive Parties: \u00a7f{len(self.party_manager.parties)}")
+        lines.append(f"\u00a7eOnline Players: \u00a7f{len(self.server.online_players)}")
+        lines.append(f"\u00a7eCurrent TPS: \u00a7f{self.server.current_tps:.2f}")
+        lines.append(f"\u00a7eAverage TPS: \u00a7f{self.server.average_tps:.2f}")
+        lines.append(f"\u00a7eCurrent MSPT: \u00a7f{self.server.current_mspt:.2f}")
+        lines.append(f"\u00a7eAverage MSPT: \u00a7f{self.server.average_mspt:.2f}")
         current_tick_usage = getattr(self.server, "current_tick_usage", None)
         if isinstance(current_tick_usage, (int, float)):
-            sender.send_message(f"\u00a7eCurrent Tick Usage: \u00a7f{current_tick_usage:.2f}")
+            lines.append(f"\u00a7eCurrent Tick Usage: \u00a7f{current_tick_usage:.2f}")
         average_tick_usage = getattr(self.server, "average_tick_usage", None)
         if isinstance(average_tick_usage, (int, float)):
-            sender.send_message(f"\u00a7eAverage Tick Usage: \u00a7f{average_tick_usage:.2f}")
-        sender.send_message("\u00a78================================")
+            lines.append(f"\u00a7eAverage Tick Usage: \u00a7f{average_tick_usage:.2f}")
+        lines.append(MSG_FOOTER)
+        sender.send_message("\n".join(lines))
         return True
 
     def _send_party_help(self, player: Player) -> None:
-        player.send_message("\u00a78========== \u00a76Party Commands \u00a78==========")
-        player.send_message("\u00a7e/party create \u00a77- Create a new party")
-        player.send_message("\u00a7e/party name <name> \u00a77- Set party name")
-        player.send_message("\u00a7e/party invite <player> \u00a77- Invite a player")
-        player.send_message("\u00a7e/party join <player> \u00a77- Request to join party")
-        player.send_message("\u00a7e/party accept \u00a77- Accept an invite")
-        player.send_message("\u00a7e/party requests \u00a77- View join requests")
-        player.send_message("\u00a7e/party leave \u00a77- Leave your party")
-        player.send_message("\u00a7e/party kick <player> \u00a77- Kick a member")
-        player.send_message("\u00a7e/party promote <player> \u00a77- Transfer leadership")
-        player.send_message("\u00a7e/party setrank <player> <rank> \u00a77- Set member rank")
-        player.send_message("\u00a7e/party ban|unban <player> \u00a77- Manage party bans")
-        player.send_message("\u00a7e/party public|private \u00a77- Set party privacy")
-        player.send_message("\u00a7e/party sethome \u00a77- Set party home")
-        player.send_message("\u00a7e/party home \u00a77- Teleport to party home")
-        player.send_message("\u00a7e/party warp \u00a77- Teleport to leader")
-        player.send_message("\u00a7e/party color <color> \u00a77- Set party color")
-        player.send_message("\u00a7e/party icon <icon> \u00a77- Set party icon")
-        player.send_message("\u00a7e/party ally <add|remove|list> \u00a77- Manage allies")
-        player.send_message("\u00a7e/party list \u00a77- List members")
-        player.send_message("\u00a7e/party info \u00a77- Party details")
-        player.send_message("\u00a7e/party stats \u00a77- Party statistics")
-        player.send_message("\u00a7e/party leaderboard <kills|playtime|members|kd|achievements> \u00a77- Rankings")
-        player.send_message("\u00a7e/party achievements \u00a77- View achievements")
-        player.send_message("\u00a7e/party show \u00a77- Toggle party member list")
-        player.send_message("\u00a78================================")
+        player.send_message(PARTY_HELP_TEXT)
 
     def _send_party_admin_help(self, sender: CommandSender) -> None:
-        sender.send_message("\u00a78========== \u00a76Party Admin Commands \u00a78==========")
-        sender.send_message("\u00a7e/partyadmin list \u00a77- List active parties")
-        sender.send_message("\u00a7e/partyadmin info <player> \u00a77- Show party details")
-        sender.send_message("\u00a7e/partyadmin disband <player> \u00a77- Disband a party")
-        sender.send_message("\u00a7e/partyadmin teleport <player> \u00a77- Teleport to party home")
-        sender.send_message("\u00a7e/partyadmin reload \u00a77- Reload configuration")
-        sender.send_message("\u00a7e/partyadmin health \u00a77- Show plugin health")
-        sender.send_message("\u00a78================================")
+        sender.send_message(PARTY_ADMIN_HELP_TEXT)
 
     def _handle_party_chat(self, player: Player, content: str) -> None:
         if not content:
@@ -1695,62 +1752,85 @@ class EuphoriaPartiesPlugin(Plugin):
             player.send_message(self.msg("not-in-party"))
             return
 
-        fmt = str(self.get_config("party.party-chat-format", "\u00a78[\u00a76Party\u00a78] \u00a7f{player}\u00a77: \u00a7f{message}"))
-        message = fmt.replace("{player}", player.name).replace("{message}", content)
+        # Single pass, so braces typed into the message are never substituted.
+        message = render_template(self._cfg.chat_template, {"player": player.name, "message": content})
         self.party_manager.broadcast_to_party(party, message)
 
     def _find_member_id_by_name(self, party: Party, token: str) -> UUID | None:
-        normalized = token.strip().lower()
-        for member_id in party.members:
-            member = self.server.get_player(member_id)
-            if member is not None and member.name.lower() == normalized:
-                return member_id
-            known_name = self.party_manager.player_names.get(member_id)
-            if known_name is not None and known_name.lower() == normalized:
-                return member_id
-
-        try:
-            parsed = UUID(token)
-        except Exception:
-            return None
-        return parsed if parsed in party.members else None
+        return self._find_player_id_in(party.members, token)
 
     def _find_requester_id(self, party: Party, token: str) -> UUID | None:
-        normalized = token.strip().lower()
-        for requester_id in party.join_requests:
-            requester = self.server.get_player(requester_id)
-            if requester is not None and requester.name.lower() == normalized:
-                return requester_id
-            known_name = self.party_manager.player_names.get(requester_id)
-            if known_name is not None and known_name.lower() == normalized:
-                return requester_id
-
-        try:
-            parsed = UUID(token)
-        except Exception:
-            return None
-        return parsed if parsed in party.join_requests else None
+        return self._find_player_id_in(party.join_requests, token)
 
     def _find_banned_player_id(self, party: Party, token: str) -> UUID | None:
+        return self._find_player_id_in(party.banned_players, token)
+
+    def _find_player_id_in(self, candidates: Collection[UUID], token: str) -> UUID | None:
+        indexed_id = self.party_manager.find_player_id_by_name(token)
+        if indexed_id is not None and indexed_id in candidates:
+            return indexed_id
+
+        # The index keeps one UUID per name; scan in case a stale name is shared with another player.
         normalized = token.strip().lower()
-        for banned_id in party.banned_players:
-            banned_player = self.server.get_player(banned_id)
-            if banned_player is not None and banned_player.name.lower() == normalized:
-                return banned_id
-            known_name = self.party_manager.player_names.get(banned_id)
+        online_players = self.party_manager.online_players
+        player_names = self.party_manager.player_names
+        for player_id in candidates:
+            player = online_players.get(player_id)
+            if player is not None and player.name.lower() == normalized:
+                return player_id
+            known_name = player_names.get(player_id)
             if known_name is not None and known_name.lower() == normalized:
-                return banned_id
+                return player_id
 
         try:
             parsed = UUID(token)
         except Exception:
             return None
-        return parsed if parsed in party.banned_players else None
+        return parsed if parsed in candidates else None
 
     def _party_display_name(self, party: Party) -> str:
         if party.name:
             return f"{party.color}{party.icon} {party.name}"
-        return f"Party #{str(party.id)[:8]}"
+        return f"Party #{party.id.hex[:8]}"
+
+
+# Handler annotations are only strings under deferred evaluation (PEP 563/649); otherwise
+# they already reference the imported event classes and need no resolving on enable.
+_DEFERRED_ANNOTATIONS = isinstance(EuphoriaPartiesPlugin.on_player_join.__annotations__.get("event"), str)
+
+
+def _parse_quoted_name(args: list[str]) -> str | None:
+    """Join name arguments, dropping one pair of wrapping quotes; None when nothing was given."""
+    name = " ".join(args).strip()
+    if not name:
+        return None
+    # Fallback for rare cases where the command parser includes wrapping quotes.
+    if len(name) >= 2 and name[0] == name[-1] and name[0] in "\"'":
+        name = name[1:-1].strip()
+    return name
+
+
+def _resolve_attacker(source: Any) -> Any:
+    attacker = source.damaging_actor
+    if attacker is not None:
+        return attacker
+    return source.actor
+
+
+def _monotonic_ms() -> int:
+    return time.monotonic_ns() // 1_000_000
+
+
+def _lookup_config_path(config: Any, path: str) -> Any:
+    cursor = config
+    for segment in path.split("."):
+        try:
+            if segment not in cursor:
+                return _MISSING
+            cursor = cursor[segment]
+        except Exception:
+            return _MISSING
+    return cursor
 
 
 def _parse_version(value: str) -> tuple[int, ...]:
@@ -0,0 +1,97 @@
+# Static chat lines shared across command and event handlers.
+MSG_PLAYER_ONLY = "\u00a7cThis command can only be used by players!"
+MSG_NO_PERMISSION = "\u00a7cYou do not have permission to use this command."
+MSG_NO_INVITE = "\u00a7cYou do not have any pending party invites!"
+MSG_PLAYER_NOT_FOUND = "\u00a7cPlayer not found or not online!"
+MSG_NOT_IN_YOUR_PARTY = "\u00a7cThat player is not in your party."
+MSG_TARGET_NOT_IN_PARTY = "\u00a7cThat player is not in a party."
+MSG_NO_JOIN_REQUEST = "\u00a7cNo matching join request found."
+MSG_FF_DISABLED = "\u00a7cFriendly fire is disabled for party members."
+CHAT_PREFIX = "\u00a78[\u00a76Party\u00a78] "
+MSG_FOOTER = "\u00a78================================"
+ONLINE_PREFIX = "\u00a7a+ \u00a77"
+ONLINE_SUFFIX = " \u00a7ais now online"
+OFFLINE_PREFIX = "\u00a7c- \u00a77"
+OFFLINE_SUFFIX = " \u00a7cis now offline"
+
+# Screen headers.
+HEADER_PARTY_MEMBERS = "\u00a78[\u00a76Party Members\u00a78]"
+HEADER_PARTY_INFO = "\u00a78========== \u00a76Party Info \u00a78=========="
+HEADER_JOIN_REQUESTS = "\u00a78========== \u00a76Join Requests \u00a78=========="
+HEADER_PARTY_ALLIES = "\u00a78========== \u00a76Party Allies \u00a78=========="
+HEADER_PARTY_STATS = "\u00a78========== \u00a76Party Statistics \u00a78=========="
+HEADER_LEADERBOARD = "\u00a78========== \u00a76Party Leaderboard \u00a78=========="
+HEADER_ACHIEVEMENTS = "\u00a78========== \u00a76Party Achievements \u00a78=========="
+HEADER_ACTIVE_PARTIES = "\u00a78========== \u00a76Active Parties \u00a78=========="
+HEADER_PLUGIN_HEALTH = "\u00a78========== \u00a76Plugin Health \u00a78=========="
+
+# Templates for replies and broadcasts that name a player or party; fill with str.format.
+FMT_NOT_IN_A_PARTY = "\u00a7c{} is not in a party."
+FMT_PLAYER_BANNED = "\u00a7c{} was banned from the party!"
+FMT_PLAYER_UNBANNED = "\u00a7aUnbanned {} from the party."
+FMT_ALLY_FORMED = "\u00a7aFormed alliance with {}\u00a7a!"
+FMT_ALLY_REMOVED = "\u00a7cRemoved alliance with {}\u00a7c."
+
+# Usage replies.
+USAGE_ALLY = "\u00a7cUsage: /party ally <add|remove|list> [player]"
+USAGE_INVITE = "\u00a7cUsage: /party invite <player>"
+USAGE_KICK = "\u00a7cUsage: /party kick <player>"
+USAGE_PROMOTE = "\u00a7cUsage: /party promote <player>"
+USAGE_NAME = "\u00a7cUsage: /party name <name>"
+USAGE_JOIN = "\u00a7cUsage: /party join <player>"
+USAGE_ACCEPTREQUEST = "\u00a7cUsage: /party acceptrequest <player>"
+USAGE_DENYREQUEST = "\u00a7cUsage: /party denyrequest <player>"
+USAGE_SETRANK = "\u00a7cUsage: /party setrank <player> <officer|member|recruit>"
+USAGE_BAN = "\u00a7cUsage: /party ban <player>"
+USAGE_UNBAN = "\u00a7cUsage: /party unban <player>"
+USAGE_COLOR = "\u00a7cUsage: /party color <color>"
+USAGE_ICON = "\u00a7cUsage: /party icon <icon>"
+USAGE_LEADERBOARD = "\u00a7cUsage: /party leaderboard <kills|playtime|members|kd|achievements>"
+USAGE_ADMIN_INFO = "\u00a7cUsage: /partyadmin info <player>"
+USAGE_ADMIN_DISBAND = "\u00a7cUsage: /partyadmin disband <player>"
+USAGE_ADMIN_TELEPORT = "\u00a7cUsage: /partyadmin teleport <player>"
+
+# Help screens are sent as a single multi-line message.
+PARTY_HELP_TEXT = "\n".join(
+    (
+        "\u00a78========== \u00a76Party Commands \u00a78==========",
+        "\u00a7e/party create \u00a77- Create a new party",
+        "\u00a7e/party name <name> \u00a77- Set party name",
+        "\u00a7e/party invite <player> \u00a77- Invite a player",
+        "\u00a7e/party join <player> \u00a77- Request to join party",
+        "\u00a7e/party accept \u00a77- Accept an invite",
+        "\u00a7e/party requests \u00a77- View join requests",
+        "\u00a7e/party leave \u00a77- Leave your party",
+        "\u00a7e/party kick <player> \u00a77- Kick a member",
+        "\u00a7e/party promote <player> \u00a77- Transfer leadership",
+        "\u00a7e/party setrank <player> <rank> \u00a77- Set member rank",
+        "\u00a7e/party ban|unban <player> \u00a77- Manage party bans",
+        "\u00a7e/party public|private \u00a77- Set party privacy",
+        "\u00a7e/party sethome \u00a77- Set party home",
+        "\u00a7e/party home \u00a77- Teleport to party home",
+        "\u00a7e/party warp \u00a77- Teleport to leader",
+        "\u00a7e/party color <color> \u00a77- Set party color",
+        "\u00a7e/party icon <icon> \u00a77- Set party icon",
+        "\u00a7e/party ally <add|remove|list> \u00a77- Manage allies",
+        "\u00a7e/party list \u00a77- List members",
+        "\u00a7e/party info \u00a77- Party details",
+        "\u00a7e/party stats \u00a77- Party statistics",
+        "\u00a7e/party leaderboard <kills|playtime|members|kd|achievements> \u00a77- Rankings",
+        "\u00a7e/party achievements \u00a77- View achievements",
+        "\u00a7e/party show \u00a77- Toggle party member list",
+        MSG_FOOTER,
+    )
+)
+
+PARTY_ADMIN_HELP_TEXT = "\n".join(
+    (
+        "\u00a78========== \u00a76Party Admin Commands \u00a78==========",
+        "\u00a7e/partyadmin list \u00a77- List active parties",
+        "\u00a7e/partyadmin info <player> \u00a77- Show party details",
+        "\u00a7e/partyadmin disband <player> \u00a77- Disband a party",
+        "\u00a7e/partyadmin teleport <player> \u00a77- Teleport to party home",
+        "\u00a7e/partyadmin reload \u00a77- Reload configuration",
+        "\u00a7e/partyadmin health \u00a77- Show plugin health",
+        MSG_FOOTER,
+    )
+)
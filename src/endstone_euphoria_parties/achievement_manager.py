@@ -2,9 +2,12 @@
 
 from typing import TYPE_CHECKING
 
+from ._msgs import CHAT_PREFIX
 from .models import Party, PartyAchievement
 
 if TYPE_CHECKING:
+    from endstone import Player
+
     from . import EuphoriaPartiesPlugin
 
 
@@ -22,27 +25,42 @@ class PartyAchievementManager:
         return list(self._achievements.values())
 
     def check(self, party: Party) -> None:
+        if not party.achievements_stale:
+            return
+        party.achievements_stale = False
+        if self._achievements.keys() <= party.achievements:
+            return
+
         member_count = len(party.members)
         play_time = party.total_play_time_ms
         kills = party.total_kills
-
-        self._try_unlock(party, "party_started", member_count >= 1)
-        self._try_unlock(party, "team_player", member_count >= 5)
-        self._try_unlock(party, "full_house", member_count >= self.plugin.get_config("party.max-members", 8))
-
-        self._try_unlock(party, "dedicated", play_time >= 36_000_000)
-        self._try_unlock(party, "veteran", play_time >= 180_000_000)
-
-        self._try_unlock(party, "first_blood", kills >= 10)
-        self._try_unlock(party, "slayer", kills >= 100)
-
-        if party.total_deaths > 0:
-            kd_ratio = kills / party.total_deaths
-            self._try_unlock(party, "survivor", kd_ratio >= 2.0)
-
         streak = party.consecutive_days
-        self._try_unlock(party, "consistent", streak >= 7)
-        self._try_unlock(party, "devoted", streak >= 30)
+        conditions = (
+            ("party_started", member_count >= 1),
+            ("team_player", member_count >= 5),
+            ("full_house", member_count >= self.plugin.get_config("party.max-members", 8)),
+            ("dedicated", play_time >= 36_000_000),
+            ("veteran", play_time >= 180_000_000),
+            ("first_blood", kills >= 10),
+            ("slayer", kills >= 100),
+            ("survivor", party.total_deaths > 0 and kills / party.total_deaths >= 2.0),
+            ("consistent", streak >= 7),
+            ("devoted", streak >= 30),
+        )
+        unlocked = [
+            achievement
+            for achievement_id, condition in conditions
+            if (achievement := self._try_unlock(party, achievement_id, condition)) is not None
+        ]
+        if not unlocked:
+            return
+
+        self.plugin.party_manager.mark_dirty(party.id)
+        # Resolve online members once for every unlock in this pass.
+        online_players = self.plugin.party_manager.online_players
+        online = [member for member_id in party.member_snapshot if (member := online_players.get(member_id)) is not None]
+        for achievement in unlocked:
+            self._announce(achievement, online)
 
     def _register_defaults(self) -> None:
         self._achievements["party_started"] = PartyAchievement(
@@ -126,21 +144,24 @@ class PartyAchievementManager:
             2_500,
         )
 
-    def _try_unlock(self, party: Party, achievement_id: str, condition: bool) -> None:
+    def _try_unlock(self, party: Party, achievement_id: str, condition: bool) -> PartyAchievement | None:
         if not condition or party.has_achievement(achievement_id):
-            return
+            return None
 
         achievement = self._achievements.get(achievement_id)
         if achievement is None:
-            return
+            return None
 
         party.unlock_achievement(achievement_id)
-        for member_id in party.members:
-            member = self.plugin.server.get_player(member_id)
-            if member is None:
-                continue
-            member.send_message("\u00a78[\u00a76Party\u00a78] \u00a7eAchievement Unlocked!")
-            member.send_message(f"{achievement.name} \u00a77- {achievement.description}")
-            if achievement.reward_type == "xp":
-                member.give_exp(achievement.reward_amount)
-                member.send_message(f"\u00a77Reward: \u00a7e+{achievement.reward_amount} XP")
+        return achievement
+
+    def _announce(self, achievement: PartyAchievement, online: list["Player"]) -> None:
+        xp_reward = achievement.reward_amount if achievement.reward_type == "xp" else 0
+        message = f"{CHAT_PREFIX}\u00a7eAchievement Unlocked!\n{achievement.name} \u00a77- {achievement.description}"
+        if xp_reward:
+            message += f"\n\u00a77Reward: \u00a7e+{xp_reward} XP"
+
+        for member in online:
+            member.send_message(message)
+            if xp_reward:
+                member.give_exp(xp_reward)
@@ -1,16 +1,25 @@
 ﻿from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from endstone.boss import BarColor, BarStyle
 
+from .templates import compile_template, render_template
+
 if TYPE_CHECKING:
     from endstone import Player
     from endstone.boss import BossBar
 
     from . import EuphoriaPartiesPlugin
 
+_DISPLAY_TYPES = frozenset({"auto", "tip", "popup", "title", "bossbar"})
+
+# Config values are matched case-insensitively with '-' or '_' separators, e.g. "light-purple" or "SEGMENTED_6".
+_BAR_COLORS = {name.lower(): member for name, member in BarColor.__members__.items()}
+_BAR_STYLES = {name.lower(): member for name, member in BarStyle.__members__.items()}
+
 
 class HUDManager:
     def __init__(self, plugin: "EuphoriaPartiesPlugin") -> None:
@@ -19,9 +28,16 @@ class HUDManager:
         self._compass_enabled: dict[UUID, bool] = {}
         self._task = None
         self._bossbars: dict[UUID, "BossBar"] = {}
+        # Last title pushed to each player's bar; the player was attached when the bar was created.
+        self._bossbar_titles: dict[UUID, str] = {}
+        # (block position, compass sector) -> payload from the previous tick, so stationary players reuse their text.
+        self._last_payloads: dict[UUID, tuple[tuple[Any, Any], str]] = {}
+        self._cfg = self._read_config()
 
     def start(self) -> None:
         self.stop()
+        self._cfg = self._read_config()
+        self._last_payloads.clear()
         interval = int(self.plugin.get_config("hud.coordinates.update-interval", 20))
         interval = max(1, interval)
         self._task = self.plugin.server.scheduler.run_task(self.plugin, self._update_hud, delay=interval, period=interval)
@@ -34,16 +50,60 @@ class HUDManager:
     def reload(self) -> None:
         self.start()
 
+    def _read_config(self) -> SimpleNamespace:
+        """Snapshot the HUD settings read on every tick; refreshed by start()/reload()."""
+        get_config = self.plugin.get_config
+
+        display_type = str(get_config("hud.display-type", "auto")).lower()
+        if display_type not in _DISPLAY_TYPES:
+            display_type = "auto"
+
+        bar_color = str(get_config("hud.bossbar.color", "white")).lower().replace("-", "_")
+        bar_style = str(get_config("hud.bossbar.style", "solid")).lower().replace("-", "_")
+        try:
+            bar_progress = float(get_config("hud.bossbar.progress", 1.0))
+        except (TypeError, ValueError):
+            bar_progress = 1.0
+
+        return SimpleNamespace(
+            display_type=display_type,
+            scoreboard_display=str(get_config("party.scoreboard.display-type", "popup")).lower(),
+            title_stay=max(0, int(get_config("hud.title-stay", 20))),
+            bossbar_color=_BAR_COLORS.get(bar_color, BarColor.WHITE),
+            bossbar_style=_BAR_STYLES.get(bar_style, BarStyle.SOLID),
+            bossbar_progress=max(0.0, min(1.0, bar_progress)),
+            coordinates_default=bool(get_config("hud.coordinates.default-enabled", True)),
+            compass_default=bool(get_config("hud.compass.default-enabled", True)),
+            coord_template=compile_template(
+                get_config("hud.coordinates.format", "\u00a7eX: \u00a7f{x} \u00a7eY: \u00a7f{y} \u00a7eZ: \u00a7f{z}")
+            ),
+            # Ordered by 45-degree sector clockwise from south; _yaw_sector picks the index.
+            directions=tuple(
+                get_config(f"hud.compass.directions.{name}", default)
+                for name, default in (
+                    ("south", "\u00a7cS"),
+                    ("southwest", "\u00a7cSW"),
+                    ("west", "\u00a7cW"),
+                    ("northwest", "\u00a7cNW"),
+                    ("north", "\u00a7cN"),
+                    ("northeast", "\u00a7cNE"),
+                    ("east", "\u00a7cE"),
+                    ("southeast", "\u00a7cSE"),
+                )
+            ),
+        )
+
     def remove_player(self, player_id: UUID) -> None:
         self._coordinates_enabled.pop(player_id, None)
         self._compass_enabled.pop(player_id, None)
+        self._last_payloads.pop(player_id, None)
         self._clear_bossbar(player_id, None)
 
     def is_coordinates_enabled(self, player_id: UUID) -> bool:
-        return self._coordinates_enabled.get(player_id, bool(self.plugin.get_config("hud.coordinates.default-enabled", True)))
+        return self._coordinates_enabled.get(player_id, self._cfg.coordinates_default)
 
     def is_compass_enabled(self, player_id: UUID) -> bool:
-        return self._compass_enabled.get(player_id, bool(self.plugin.get_config("hud.compass.default-enabled", True)))
+        return self._compass_enabled.get(player_id, self._cfg.compass_default)
 
     def toggle_coordinates(self, player: "Player") -> None:
         player_id = player.unique_id
@@ -59,47 +119,32 @@ class HUDManager:
         message_key = "compass-enabled" if enabled else "compass-disabled"
         player.send_message(self.plugin.msg(message_key))
 
-    def _resolve_display_type(self, player_id: UUID) -> str:
-        display_type = str(self.plugin.get_config("hud.display-type", "auto")).lower()
-        if display_type not in {"auto", "tip", "popup", "title", "bossbar"}:
-            display_type = "auto"
-
+    def _resolve_display_type(self, scoreboard_enabled: bool) -> str:
+        display_type = self._cfg.display_type
         if display_type == "auto":
             preferred = "popup"
-            scoreboard_display = str(self.plugin.get_config("party.scoreboard.display-type", "popup")).lower()
-            scoreboard_manager = getattr(self.plugin, "scoreboard_manager", None)
-            scoreboard_enabled = bool(scoreboard_manager) and scoreboard_manager.is_enabled(player_id)
-            if scoreboard_enabled and scoreboard_display == preferred:
+            if scoreboard_enabled and self._cfg.scoreboard_display == preferred:
                 return "tip"
             return preferred
 
         return display_type
 
-    def _resolve_bossbar_color(self) -> BarColor:
-        raw = str(self.plugin.get_config("hud.bossbar.color", "white")).upper().replace("-", "_")
-        return getattr(BarColor, raw, BarColor.WHITE)
-
-    def _resolve_bossbar_style(self) -> BarStyle:
-        raw = str(self.plugin.get_config("hud.bossbar.style", "solid")).upper().replace("-", "_")
-        return getattr(BarStyle, raw, BarStyle.SOLID)
-
-    def _resolve_bossbar_progress(self) -> float:
-        try:
-            progress = float(self.plugin.get_config("hud.bossbar.progress", 1.0))
-        except (TypeError, ValueError):
-            progress = 1.0
-        return max(0.0, min(1.0, progress))
-
-    def _get_or_create_bossbar(self, player_id: UUID) -> "BossBar":
+    def _show_bossbar(self, player: "Player", player_id: UUID, title: str) -> None:
         bar = self._bossbars.get(player_id)
         if bar is None:
-            bar = self.plugin.server.create_boss_bar("", self._resolve_bossbar_color(), self._resolve_bossbar_style())
-            bar.progress = self._resolve_bossbar_progress()
+            bar = self.plugin.server.create_boss_bar(title, self._cfg.bossbar_color, self._cfg.bossbar_style)
+            bar.progress = self._cfg.bossbar_progress
+            bar.add_player(player)
             self._bossbars[player_id] = bar
-        return bar
+            self._bossbar_titles[player_id] = title
+            return
+        if self._bossbar_titles.get(player_id) != title:
+            bar.title = title
+            self._bossbar_titles[player_id] = title
 
     def _clear_bossbar(self, player_id: UUID, player: "Player" | None) -> None:
         bar = self._bossbars.pop(player_id, None)
+        self._bossbar_titles.pop(player_id, None)
         if bar is None:
             return
         if player is not None:
@@ -113,16 +158,22 @@ class HUDManager:
             except Exception:
                 pass
 
+    def _hud_possibly_active(self) -> bool:
+        cfg = self._cfg
+        if cfg.coordinates_default or cfg.compass_default or self._bossbars:
+            return True
+        # Both features default to off: only players who switched one on need a pass.
+        return True in self._coordinates_enabled.values() or True in self._compass_enabled.values()
+
     def _update_hud(self) -> None:
-        coord_format = str(
-            self.plugin.get_config(
-                "hud.coordinates.format",
-                "\u00a7eX: \u00a7f{x} \u00a7eY: \u00a7f{y} \u00a7eZ: \u00a7f{z}",
-            )
-        )
+        if not self._hud_possibly_active():
+            return
+
+        cfg = self._cfg
+        coord_template = cfg.coord_template
+        scoreboard_manager = getattr(self.plugin, "scoreboard_manager", None)
 
-        for player in self.plugin.server.online_players:
-            player_id = player.unique_id
+        for player_id, player in tuple(self.plugin.party_manager.online_players.items()):
             show_coords = self.is_coordinates_enabled(player_id)
             show_compass = self.is_compass_enabled(player_id)
 
@@ -130,64 +181,45 @@ class HUDManager:
                 self._clear_bossbar(player_id, player)
                 continue
 
-            parts: list[str] = []
-            if show_coords:
-                location = player.location
-                parts.append(
-                    coord_format.replace("{x}", str(int(location.x)))
-                    .replace("{y}", str(int(location.y)))
-                    .replace("{z}", str(int(location.z)))
-                )
-
-            if show_compass:
-                parts.append(self._direction_text(player.location.yaw))
-
-            payload = "  \u00a77|  ".join(parts)
-            display_type = self._resolve_display_type(player_id)
+            location = player.location
+            block = (int(location.x), int(location.y), int(location.z)) if show_coords else None
+            sector = _yaw_sector(location.yaw) if show_compass else None
+            cached = self._last_payloads.get(player_id)
+            if cached is not None and cached[0] == (block, sector):
+                payload = cached[1]
+            else:
+                parts: list[str] = []
+                if block is not None:
+                    parts.append(render_template(coord_template, {"x": block[0], "y": block[1], "z": block[2]}))
+                if sector is not None:
+                    parts.append(self._direction_text(sector))
+                payload = "  \u00a77|  ".join(parts)
+                self._last_payloads[player_id] = ((block, sector), payload)
+            scoreboard_enabled = scoreboard_manager is not None and scoreboard_manager.is_enabled(player_id)
+            display_type = self._resolve_display_type(scoreboard_enabled)
             if display_type != "bossbar":
                 self._clear_bossbar(player_id, player)
 
             if display_type == "bossbar":
-                bar = self._get_or_create_bossbar(player_id)
-                bar.title = payload
-                bar.add_player(player)
+                self._show_bossbar(player, player_id, payload)
                 continue
 
             if display_type == "title":
-                stay = int(self.plugin.get_config("hud.title-stay", 20))
-                stay = max(0, stay)
-                player.send_title(payload, "", 0, stay, 0)
+                player.send_title(payload, "", 0, cfg.title_stay, 0)
                 continue
 
-            scoreboard_manager = getattr(self.plugin, "scoreboard_manager", None)
-            if scoreboard_manager is not None and scoreboard_manager.is_enabled(player_id):
-                scoreboard_display = str(self.plugin.get_config("party.scoreboard.display-type", "popup")).lower()
-                if display_type == scoreboard_display:
-                    continue
+            if scoreboard_enabled and display_type == cfg.scoreboard_display:
+                continue
 
             if display_type == "popup":
                 player.send_popup(payload)
             else:
                 player.send_tip(payload)
 
-    def _direction_text(self, yaw: float) -> str:
-        normalized = yaw % 360.0
-
-        if normalized >= 337.5 or normalized < 22.5:
-            direction = self.plugin.get_config("hud.compass.directions.south", "\u00a7cS")
-        elif normalized < 67.5:
-            direction = self.plugin.get_config("hud.compass.directions.southwest", "\u00a7cSW")
-        elif normalized < 112.5:
-            direction = self.plugin.get_config("hud.compass.directions.west", "\u00a7cW")
-        elif normalized < 157.5:
-            direction = self.plugin.get_config("hud.compass.directions.northwest", "\u00a7cNW")
-        elif normalized < 202.5:
-            direction = self.plugin.get_config("hud.compass.directions.north", "\u00a7cN")
-        elif normalized < 247.5:
-            direction = self.plugin.get_config("hud.compass.directions.northeast", "\u00a7cNE")
-        elif normalized < 292.5:
-            direction = self.plugin.get_config("hud.compass.directions.east", "\u00a7cE")
-        else:
-            direction = self.plugin.get_config("hud.compass.directions.southeast", "\u00a7cSE")
+    def _direction_text(self, sector: int) -> str:
+        return f"\u00a7eDir: {self._cfg.directions[sector]}"
+
 
-        return f"\u00a7eDir: {direction}"
+def _yaw_sector(yaw: float) -> int:
+    # Eight 45-degree sectors starting at south (-22.5..22.5); the & 7 wraps 337.5+ back to south.
+    return int((yaw % 360.0 + 22.5) // 45.0) & 7
@@ -1,32 +1,68 @@
 ﻿from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import heapq
+from operator import attrgetter, itemgetter
+from typing import TYPE_CHECKING, Any, Callable
 
 from .models import Party
 
 if TYPE_CHECKING:
     from . import EuphoriaPartiesPlugin
 
+_MS_PER_HOUR = 1000 * 60 * 60
+
+
+def _member_count(party: Party) -> int:
+    return len(party.members)
+
+
+def _achievement_count(party: Party) -> int:
+    return len(party.achievements)
+
+
+_BY_KILLS = attrgetter("total_kills")
+_BY_PLAYTIME = attrgetter("total_play_time_ms")
+_BY_KD = attrgetter("kd_ratio")
+
 
 class PartyLeaderboardManager:
     def __init__(self, plugin: "EuphoriaPartiesPlugin") -> None:
         self.plugin = plugin
+        # metric -> (party_manager, revision, limit, ranking) from the last query. The manager is kept because
+        # revisions restart at zero whenever a new one is created, e.g. on reload.
+        self._rankings: dict[Callable[[Party], Any], tuple[Any, int, int, list[tuple[Party, Any]]]] = {}
+
+    def _top(self, metric: Callable[[Party], Any], limit: int) -> list[tuple[Party, Any]]:
+        party_manager = self.plugin.party_manager
+        cached = self._rankings.get(metric)
+        if (
+            cached is not None
+            and cached[0] is party_manager
+            and cached[1] == party_manager.revision
+            and cached[2] >= limit
+        ):
+            return cached[3][:limit]
+
+        # Each party's metric is computed once and handed back alongside it for display.
+        # Only the top few are shown, so a bounded heap beats sorting every party.
+        ranked = [(party, metric(party)) for party in party_manager.parties.values()]
+        ranking = heapq.nlargest(limit, ranked, key=itemgetter(1))
+        self._rankings[metric] = (party_manager, party_manager.revision, limit, ranking)
+        return ranking[:]
 
-    def top_by_kills(self, limit: int = 10) -> list[Party]:
-        return sorted(self.plugin.party_manager.parties.values(), key=lambda party: party.total_kills, reverse=True)[:limit]
+    def top_by_kills(self, limit: int = 10) -> list[tuple[Party, int]]:
+        return self._top(_BY_KILLS, limit)
 
-    def top_by_playtime(self, limit: int = 10) -> list[Party]:
-        return sorted(self.plugin.party_manager.parties.values(), key=lambda party: party.total_play_time_ms, reverse=True)[:limit]
+    def top_by_playtime(self, limit: int = 10) -> list[tuple[Party, int]]:
+        """Rank by total play time; the paired value is whole hours."""
+        ranked = self._top(_BY_PLAYTIME, limit)
+        return [(party, play_time_ms // _MS_PER_HOUR) for party, play_time_ms in ranked]
 
-    def top_by_members(self, limit: int = 10) -> list[Party]:
-        return sorted(self.plugin.party_manager.parties.values(), key=lambda party: len(party.members), reverse=True)[:limit]
+    def top_by_members(self, limit: int = 10) -> list[tuple[Party, int]]:
+        return self._top(_member_count, limit)
 
-    def top_by_kd(self, limit: int = 10) -> list[Party]:
-        return sorted(
-            self.plugin.party_manager.parties.values(),
-            key=lambda party: (party.total_kills / party.total_deaths) if party.total_deaths > 0 else float(party.total_kills),
-            reverse=True,
-        )[:limit]
+    def top_by_kd(self, limit: int = 10) -> list[tuple[Party, float]]:
+        return self._top(_BY_KD, limit)
 
-    def top_by_achievements(self, limit: int = 10) -> list[Party]:
-        return sorted(self.plugin.party_manager.parties.values(), key=lambda party: len(party.achievements), reverse=True)[:limit]
+    def top_by_achievements(self, limit: int = 10) -> list[tuple[Party, int]]:
+        return self._top(_achievement_count, limit)
@@ -2,6 +2,8 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+import sys
 import time
 from typing import Any
 from uuid import UUID, uuid4
@@ -11,7 +13,15 @@ MILLIS_PER_DAY = 24 * 60 * 60 * 1000
 
 
 def now_ms() -> int:
-    return int(time.time() * 1000)
+    return time.time_ns() // 1_000_000
+
+
+# UUID.__str__ hex-formats on every call and saves stringify the same players over and over.
+# Ids of disbanded parties, expired invitees and other players the manager has dropped stay cached until
+# they are evicted, so the size caps that growth while leaving room for every player a server normally knows.
+@lru_cache(maxsize=8192)
+def uuid_str(value: UUID) -> str:
+    return str(value)
 
 
 class PartyRole(str, Enum):
@@ -22,41 +32,36 @@ class PartyRole(str, Enum):
 
     @property
     def level(self) -> int:
-        if self is PartyRole.LEADER:
-            return 3
-        if self is PartyRole.OFFICER:
-            return 2
-        if self is PartyRole.MEMBER:
-            return 1
-        return 0
+        return _ROLE_LEVELS[self]
 
     def can_invite(self) -> bool:
-        return self.level >= PartyRole.OFFICER.level
+        return self in _OFFICER_OR_ABOVE
 
     def can_kick(self) -> bool:
-        return self.level >= PartyRole.OFFICER.level
+        return self in _OFFICER_OR_ABOVE
 
     def can_set_home(self) -> bool:
-        return self.level >= PartyRole.OFFICER.level
+        return self in _OFFICER_OR_ABOVE
 
     def can_promote(self) -> bool:
-        return self.level >= PartyRole.LEADER.level
+        return self is PartyRole.LEADER
 
     def can_ban_players(self) -> bool:
-        return self.level >= PartyRole.OFFICER.level
+        return self in _OFFICER_OR_ABOVE
 
     @staticmethod
     def parse(value: str | None) -> "PartyRole":
         if not value:
             return PartyRole.MEMBER
-        normalized = value.strip().lower()
-        for role in PartyRole:
-            if role.value == normalized:
-                return role
-        return PartyRole.MEMBER
+        return _ROLE_BY_VALUE.get(value.strip().lower(), PartyRole.MEMBER)
 
 
-@dataclass(slots=True)
+_ROLE_LEVELS = {PartyRole.LEADER: 3, PartyRole.OFFICER: 2, PartyRole.MEMBER: 1, PartyRole.RECRUIT: 0}
+_OFFICER_OR_ABOVE = frozenset({PartyRole.LEADER, PartyRole.OFFICER})
+_ROLE_BY_VALUE = {role.value: role for role in PartyRole}
+
+
+@dataclass(slots=True, frozen=True)
 class LocationData:
     level: str
     dimension: str
@@ -70,9 +75,10 @@ class LocationData:
     def from_location(cls, location: Any) -> "LocationData":
         dimension = location.dimension
         level_name = dimension.level.name
+        # A server only has a handful of level/dimension names; share one string per name across homes.
         return cls(
-            level=level_name,
-            dimension=dimension.name,
+            level=sys.intern(level_name),
+            dimension=sys.intern(dimension.name),
             x=float(location.x),
             y=float(location.y),
             z=float(location.z),
@@ -94,8 +100,8 @@ class LocationData:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "LocationData":
         return cls(
-            level=str(data.get("level", "")),
-            dimension=str(data.get("dimension", "overworld")),
+            level=sys.intern(str(data.get("level", ""))),
+            dimension=sys.intern(str(data.get("dimension", "overworld"))),
             x=float(data.get("x", 0.0)),
             y=float(data.get("y", 0.0)),
             z=float(data.get("z", 0.0)),
@@ -114,7 +120,9 @@ class PartyAchievement:
     reward_amount: int
 
 
-@dataclass(slots=True)
+# eq=False: the manager keeps one Party per id, so identity is the meaningful equality, and the
+# generated __eq__ would walk every member set and stat dict. It also keeps Party hashable.
+@dataclass(slots=True, eq=False)
 class Party:
     id: UUID
     leader: UUID
@@ -138,6 +146,16 @@ class Party:
     last_reward_date: int = 0
     achievements: set[str] = field(default_factory=set)
     last_seen: dict[UUID, int] = field(default_factory=dict)
+    _member_snapshot: tuple[UUID, ...] | None = field(default=None, init=False, repr=False, compare=False)
+    # Sorted member ids as written by to_dict; dropped together with _member_snapshot.
+    _member_strings: tuple[str, ...] | None = field(default=None, init=False, repr=False, compare=False)
+    # Kept in step with total_kills/total_deaths so leaderboard sorts don't divide per comparison.
+    kd_ratio: float = field(default=0.0, init=False, repr=False, compare=False)
+    # Set by the stat and membership mutators; PartyAchievementManager.check clears it after a pass.
+    achievements_stale: bool = field(default=True, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._refresh_kd_ratio()
 
     @classmethod
     def create(cls, leader_id: UUID) -> "Party":
@@ -146,6 +164,20 @@ class Party:
         party.roles[leader_id] = PartyRole.LEADER
         return party
 
+    @property
+    def member_snapshot(self) -> tuple[UUID, ...]:
+        """Members as a tuple, rebuilt only after membership changes; safe to iterate while mutating."""
+        snapshot = self._member_snapshot
+        if snapshot is None:
+            snapshot = self._member_snapshot = tuple(self.members)
+        return snapshot
+
+    def _serialized_members(self) -> tuple[str, ...]:
+        strings = self._member_strings
+        if strings is None:
+            strings = self._member_strings = tuple(sorted(map(uuid_str, self.members)))
+        return strings
+
     def is_member(self, player_id: UUID) -> bool:
         return player_id in self.members
 
@@ -173,12 +205,17 @@ class Party:
 
     def add_member(self, player_id: UUID) -> None:
         self.members.add(player_id)
+        self._member_snapshot = None
+        self._member_strings = None
+        self.achievements_stale = True
         self.invites.pop(player_id, None)
         self.join_requests.pop(player_id, None)
         self.roles.setdefault(player_id, PartyRole.MEMBER)
 
     def remove_member(self, player_id: UUID) -> None:
         self.members.discard(player_id)
+        self._member_snapshot = None
+        self._member_strings = None
         self.invites.pop(player_id, None)
         self.join_requests.pop(player_id, None)
         self.roles.pop(player_id, None)
@@ -194,14 +231,9 @@ class Party:
     def remove_invite(self, player_id: UUID) -> None:
         self.invites.pop(player_id, None)
 
-    def clean_expired_invites(self, expiration_ms: int) -> set[UUID]:
-        expired: set[UUID] = set()
-        cutoff = now_ms() - expiration_ms
-        for player_id, sent_at in list(self.invites.items()):
-            if sent_at < cutoff:
-                expired.add(player_id)
-                self.invites.pop(player_id, None)
-        return expired
+    def clean_expired_invites(self, expiration_ms: int, timestamp_ms: int | None = None) -> set[UUID]:
+        now = timestamp_ms if timestamp_ms is not None else now_ms()
+        return _drop_expired(self.invites, now - expiration_ms)
 
     def add_join_request(self, player_id: UUID) -> None:
         self.join_requests[player_id] = now_ms()
@@ -212,14 +244,9 @@ class Party:
     def remove_join_request(self, player_id: UUID) -> None:
         self.join_requests.pop(player_id, None)
 
-    def clean_expired_join_requests(self, expiration_ms: int) -> set[UUID]:
-        expired: set[UUID] = set()
-        cutoff = now_ms() - expiration_ms
-        for player_id, sent_at in list(self.join_requests.items()):
-            if sent_at < cutoff:
-                expired.add(player_id)
-                self.join_requests.pop(player_id, None)
-        return expired
+    def clean_expired_join_requests(self, expiration_ms: int, timestamp_ms: int | None = None) -> set[UUID]:
+        now = timestamp_ms if timestamp_ms is not None else now_ms()
+        return _drop_expired(self.join_requests, now - expiration_ms)
 
     def ban_player(self, player_id: UUID) -> None:
         self.banned_players.add(player_id)
@@ -233,12 +260,21 @@ class Party:
 
     def add_play_time(self, milliseconds: int) -> None:
         self.total_play_time_ms += max(0, milliseconds)
+        self.achievements_stale = True
 
     def increment_kills(self) -> None:
         self.total_kills += 1
+        self._refresh_kd_ratio()
+        self.achievements_stale = True
 
     def increment_deaths(self) -> None:
         self.total_deaths += 1
+        self._refresh_kd_ratio()
+        self.achievements_stale = True
+
+    def _refresh_kd_ratio(self) -> None:
+        deaths = self.total_deaths
+        self.kd_ratio = self.total_kills / deaths if deaths > 0 else float(self.total_kills)
 
     def unlock_achievement(self, achievement_id: str) -> None:
         self.achievements.add(achievement_id)
@@ -267,31 +303,32 @@ class Party:
             self.consecutive_days = 1
 
         self.last_reward_date = now
+        self.achievements_stale = True
 
     def to_dict(self) -> dict[str, Any]:
         return {
-            "id": str(self.id),
-            "leader": str(self.leader),
-            "members": [str(member_id) for member_id in sorted(self.members, key=lambda i: str(i))],
-            "invites": {str(player_id): sent_at for player_id, sent_at in self.invites.items()},
-            "join_requests": {str(player_id): sent_at for player_id, sent_at in self.join_requests.items()},
+            "id": uuid_str(self.id),
+            "leader": uuid_str(self.leader),
+            "members": list(self._serialized_members()),
+            "invites": {uuid_str(player_id): sent_at for player_id, sent_at in self.invites.items()},
+            "join_requests": {uuid_str(player_id): sent_at for player_id, sent_at in self.join_requests.items()},
             "home": self.home.to_dict() if self.home else None,
             "created_at": self.created_at,
             "name": self.name,
             "is_public": self.is_public,
-            "roles": {str(player_id): role.value for player_id, role in self.roles.items()},
-            "banned_players": [str(player_id) for player_id in sorted(self.banned_players, key=lambda i: str(i))],
+            "roles": {uuid_str(player_id): role.value for player_id, role in self.roles.items()},
+            "banned_players": sorted(map(uuid_str, self.banned_players)),
             "total_play_time_ms": self.total_play_time_ms,
             "total_kills": self.total_kills,
             "total_deaths": self.total_deaths,
             "color": self.color,
             "icon": self.icon,
-            "allies": [str(party_id) for party_id in sorted(self.allies, key=lambda i: str(i))],
-            "last_daily_reward": {str(player_id): claimed_at for player_id, claimed_at in self.last_daily_reward.items()},
+            "allies": sorted(map(uuid_str, self.allies)),
+            "last_daily_reward": {uuid_str(player_id): claimed_at for player_id, claimed_at in self.last_daily_reward.items()},
             "consecutive_days": self.consecutive_days,
             "last_reward_date": self.last_reward_date,
             "achievements": sorted(self.achievements),
-            "last_seen": {str(player_id): seen_at for player_id, seen_at in self.last_seen.items()},
+            "last_seen": {uuid_str(player_id): seen_at for player_id, seen_at in self.last_seen.items()},
         }
 
     @classmethod
@@ -301,32 +338,27 @@ class Party:
         if party_id is None or leader_id is None:
             return None
 
-        members = {_parse_uuid(raw_member) for raw_member in data.get("members", [])}
-        members.discard(None)
+        members = {member for raw_member in data.get("members", []) if (member := _parse_uuid(raw_member)) is not None}
+        members.add(leader_id)
+        # Roles are kept only for current members.
+        roles = {
+            player_id: PartyRole.parse(raw_role)
+            for raw_player, raw_role in (data.get("roles") or {}).items()
+            if (player_id := _parse_uuid(raw_player)) in members
+        }
+        roles[leader_id] = PartyRole.LEADER
 
-        party = cls(
+        return cls(
             id=party_id,
             leader=leader_id,
-            members={member for member in members if isinstance(member, UUID)},
-            invites={
-                player_id: int(sent_at)
-                for raw_player, sent_at in dict(data.get("invites", {})).items()
-                if (player_id := _parse_uuid(raw_player)) is not None
-            },
-            join_requests={
-                player_id: int(sent_at)
-                for raw_player, sent_at in dict(data.get("join_requests", {})).items()
-                if (player_id := _parse_uuid(raw_player)) is not None
-            },
+            members=members,
+            invites=_parse_timestamps(data.get("invites")),
+            join_requests=_parse_timestamps(data.get("join_requests")),
             home=LocationData.from_dict(data["home"]) if isinstance(data.get("home"), dict) else None,
             created_at=int(data.get("created_at", now_ms())),
             name=data.get("name") or None,
             is_public=bool(data.get("is_public", True)),
-            roles={
-                player_id: PartyRole.parse(raw_role)
-                for raw_player, raw_role in dict(data.get("roles", {})).items()
-                if (player_id := _parse_uuid(raw_player)) is not None
-            },
+            roles=roles,
             banned_players={
                 player_id
                 for raw_player in data.get("banned_players", [])
@@ -342,33 +374,47 @@ class Party:
                 for raw_party in data.get("allies", [])
                 if (party_ref := _parse_uuid(raw_party)) is not None
             },
-            last_daily_reward={
-                player_id: int(claimed_at)
-                for raw_player, claimed_at in dict(data.get("last_daily_reward", {})).items()
-                if (player_id := _parse_uuid(raw_player)) is not None
-            },
+            last_daily_reward=_parse_timestamps(data.get("last_daily_reward")),
             consecutive_days=int(data.get("consecutive_days", 0)),
             last_reward_date=int(data.get("last_reward_date", 0)),
             achievements={str(entry) for entry in data.get("achievements", [])},
-            last_seen={
-                player_id: int(seen_at)
-                for raw_player, seen_at in dict(data.get("last_seen", {})).items()
-                if (player_id := _parse_uuid(raw_player)) is not None
-            },
+            last_seen=_parse_timestamps(data.get("last_seen")),
         )
 
-        if leader_id not in party.members:
-            party.members.add(leader_id)
-        party.roles[leader_id] = PartyRole.LEADER
 
-        # Keep roles only for current members.
-        party.roles = {player_id: role for player_id, role in party.roles.items() if player_id in party.members}
+def _drop_expired(sent: dict[UUID, int], cutoff: int) -> set[UUID]:
+    expired = {player_id for player_id, sent_at in sent.items() if sent_at < cutoff}
+    # Usually nothing has expired; only then is the dict touched.
+    for player_id in expired:
+        del sent[player_id]
+    return expired
 
-        return party
+
+def _parse_timestamps(raw: Any) -> dict[UUID, int]:
+    if not isinstance(raw, dict):
+        return {}
+    parsed: dict[UUID, int] = {}
+    for raw_player, timestamp in raw.items():
+        player_id = _parse_uuid(raw_player)
+        if player_id is None:
+            continue
+        try:
+            parsed[player_id] = int(timestamp)
+        except (TypeError, ValueError):
+            continue
+    return parsed
 
 
 def _parse_uuid(value: Any) -> UUID | None:
+    if value is None:
+        return None
+    return _parse_uuid_text(value if isinstance(value, str) else str(value))
+
+
+# A player's id shows up in members, roles, last_seen, ... so loads parse the same strings repeatedly.
+@lru_cache(maxsize=8192)
+def _parse_uuid_text(value: str) -> UUID | None:
     try:
-        return UUID(str(value))
+        return UUID(value)
     except Exception:
-        return None
+        return None
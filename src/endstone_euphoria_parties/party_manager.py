@@ -1,5 +1,6 @@
 ﻿from __future__ import annotations
 
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
@@ -24,11 +25,22 @@ class PartyManager:
 
         self.last_command_use_ms: dict[UUID, int] = {}
         self.last_teleport_ms: dict[UUID, int] = {}
-        self.last_marker_positions: dict[UUID, tuple[float, float, float]] = {}
+        self.last_marker_positions: dict[UUID, list[float]] = {}
         self.player_names: dict[UUID, str] = {}
+        self._name_lower_cache: dict[UUID, str] = {}
+        self.player_ids_by_name: dict[str, UUID] = {}
+        self.online_players: dict[UUID, "Player"] = {}
+        # Online member ids per party, kept in step with joins, leaves and connects so the periodic
+        # tasks only visit parties that have someone online.
+        self.party_online_members: dict[UUID, set[UUID]] = {}
 
         self.storage: StorageBackend = create_storage(self.plugin)
+        # _dirty asks for a full rewrite; the id sets let row-based backends write only the touched parties.
         self._dirty = False
+        self._dirty_party_ids: set[UUID] = set()
+        self._deleted_party_ids: set[UUID] = set()
+        # Bumped on every mark_dirty() and reload so derived views (leaderboards) know when to rebuild.
+        self.revision = 0
 
         self._marker_task = None
         self._playtime_task = None
@@ -42,6 +54,7 @@ class PartyManager:
     def start(self) -> None:
         self.stop()
         self._refresh_config_cache()
+        self._bootstrap_online_players()
         self._start_marker_task()
         self._start_playtime_task()
         self._start_cleanup_task()
@@ -55,11 +68,14 @@ class PartyManager:
             "command_cooldown_s": int(self.plugin.get_config("security.command-cooldown", 3)),
             "teleport_cooldown_s": int(self.plugin.get_config("security.teleport-cooldown", 30)),
             "max_teleport_distance": float(self.plugin.get_config("security.max-teleport-distance", 10_000.0)),
-            "marker_distance": float(self.plugin.get_config("party.marker-distance", 200.0)),
+            "marker_distance_sq": float(self.plugin.get_config("party.marker-distance", 200.0)) ** 2,
             "marker_particle": str(self.plugin.get_config("party.marker-particle", "minecraft:heart_particle")),
             "marker_particle_count": max(1, int(self.plugin.get_config("party.marker-particle-count", 3))),
             "optimize_markers": bool(self.plugin.get_config("performance.optimize-markers", True)),
-            "marker_move_threshold": float(self.plugin.get_config("performance.marker-move-threshold", 1.0)),
+            "marker_move_threshold_sq": float(self.plugin.get_config("performance.marker-move-threshold", 1.0)) ** 2,
+            "teleport_enabled": bool(self.plugin.get_config("party.teleport-enabled", True)),
+            "safe_teleport": bool(self.plugin.get_config("security.safe-teleport", True)),
+            "disband_when_all_offline": bool(self.plugin.get_config("party.disband-when-all-offline", False)),
         }
 
     def stop(self) -> None:
@@ -95,22 +111,95 @@ class PartyManager:
     def record_player_name(self, player: "Player") -> None:
         current = self.player_names.get(player.unique_id)
         if current != player.name:
-            self.player_names[player.unique_id] = player.name
+            self._set_player_name(player.unique_id, player.name)
             self.mark_dirty()
 
+    def record_player_online(self, player: "Player") -> None:
+        player_id = player.unique_id
+        self.online_players[player_id] = player
+        party_id = self.player_to_party.get(player_id)
+        if party_id is not None:
+            self._add_online_member(party_id, player_id)
+
+    def record_player_offline(self, player_id: UUID) -> None:
+        self.online_players.pop(player_id, None)
+        party_id = self.player_to_party.get(player_id)
+        if party_id is not None:
+            self._discard_online_member(party_id, player_id)
+
+    def _bootstrap_online_players(self) -> None:
+        self.online_players = {player.unique_id: player for player in self.plugin.server.online_players}
+        self._rebuild_online_members()
+
+    def _rebuild_online_members(self) -> None:
+        self.party_online_members = {}
+        for player_id in self.online_players:
+            party_id = self.player_to_party.get(player_id)
+            if party_id is not None:
+                self.party_online_members.setdefault(party_id, set()).add(player_id)
+
+    def _add_online_member(self, party_id: UUID, player_id: UUID) -> None:
+        if player_id in self.online_players:
+            self.party_online_members.setdefault(party_id, set()).add(player_id)
+
+    def _discard_online_member(self, party_id: UUID, player_id: UUID) -> None:
+        members = self.party_online_members.get(party_id)
+        if members is not None:
+            members.discard(player_id)
+            if not members:
+                del self.party_online_members[party_id]
+
     def get_player_name(self, player_id: UUID) -> str:
-        player = self.plugin.server.get_player(player_id)
+        player = self.online_players.get(player_id)
         if player is not None:
-            self.player_names[player_id] = player.name
+            if self.player_names.get(player_id) != player.name:
+                self._set_player_name(player_id, player.name)
             return player.name
-        return self.player_names.get(player_id, str(player_id)[:8])
+        known_name = self.player_names.get(player_id)
+        return known_name if known_name is not None else player_id.hex[:8]
+
+    def _set_player_name(self, player_id: UUID, name: str) -> None:
+        previous = self.player_names.get(player_id)
+        if previous is not None and self.player_ids_by_name.get(previous.lower()) == player_id:
+            self.player_ids_by_name.pop(previous.lower(), None)
+        self.player_names[player_id] = name
+        self.player_ids_by_name[name.lower()] = player_id
+        self._name_lower_cache.pop(player_id, None)
+
+    def find_player_id_by_name(self, name: str) -> UUID | None:
+        """Return the UUID of the player last seen with this name (case-insensitive)."""
+        return self.player_ids_by_name.get(name.strip().lower())
+
+    def find_online_player(self, name: str) -> "Player | None":
+        """Resolve an online player by name through the name index, falling back to the server lookup."""
+        player_id = self.find_player_id_by_name(name)
+        if player_id is not None:
+            player = self.online_players.get(player_id)
+            if player is not None:
+                return player
+        return self.plugin.server.get_player(name)
+
+    def get_player_name_lower(self, player_id: UUID) -> str:
+        # Sort key for name-ordered listings; dropped whenever the player's known name changes.
+        lowered = self._name_lower_cache.get(player_id)
+        if lowered is None:
+            lowered = self._name_lower_cache[player_id] = self.get_player_name(player_id).lower()
+        return lowered
 
     def save_all(self, force: bool = False) -> None:
-        if not force and not self._dirty:
+        full = force or self._dirty
+        if not full and not self._dirty_party_ids and not self._deleted_party_ids:
             return
         try:
-            self.storage.save(self.parties.values(), self.player_names)
+            if full:
+                self.storage.save(self.parties.values(), self.player_names)
+            else:
+                self.storage.save_changes(
+                    self.parties, self._dirty_party_ids, self._deleted_party_ids, self.player_names
+                )
             self._dirty = False
+            self._dirty_party_ids.clear()
+            self._deleted_party_ids.clear()
         except Exception as exc:
             self.plugin.logger.error(f"Failed to save party data: {exc}")
 
@@ -123,11 +212,21 @@ class PartyManager:
             self.player_names = {}
 
         self._dirty = False
+        self._dirty_party_ids.clear()
+        self._deleted_party_ids.clear()
+        self.revision += 1
+        self._name_lower_cache.clear()
+        self.player_ids_by_name = {name.lower(): player_id for player_id, name in self.player_names.items()}
         self._rebuild_indexes()
         self.plugin.logger.info(f"Loaded {len(self.parties)} parties")
 
-    def mark_dirty(self) -> None:
-        self._dirty = True
+    def mark_dirty(self, *party_ids: UUID) -> None:
+        # Without ids the change is not tied to particular parties, so the next save rewrites everything.
+        if party_ids:
+            self._dirty_party_ids.update(party_ids)
+        else:
+            self._dirty = True
+        self.revision += 1
 
     def _rebuild_indexes(self) -> None:
         self.player_to_party.clear()
@@ -136,7 +235,7 @@ class PartyManager:
 
         for party in self.parties.values():
             if party.leader not in party.members:
-                party.members.add(party.leader)
+                party.add_member(party.leader)
                 changed = True
             if party.roles.get(party.leader) != PartyRole.LEADER:
                 changed = True
@@ -147,6 +246,7 @@ class PartyManager:
             for invited_id in party.invites:
                 self.player_invites[invited_id] = party.id
 
+        self._rebuild_online_members()
         if changed:
             self.mark_dirty()
 
@@ -157,8 +257,9 @@ class PartyManager:
         party = Party.create(leader.unique_id)
         self.parties[party.id] = party
         self.player_to_party[leader.unique_id] = party.id
+        self._add_online_member(party.id, leader.unique_id)
         self.record_player_name(leader)
-        self.mark_dirty()
+        self.mark_dirty(party.id)
         return party
 
     def disband_party(self, party_id: UUID) -> bool:
@@ -166,16 +267,21 @@ class PartyManager:
         if party is None:
             return False
 
+        self.party_online_members.pop(party_id, None)
+
         for member_id in party.members:
             if self.player_to_party.get(member_id) == party_id:
                 self.player_to_party.pop(member_id, None)
             self.last_marker_positions.pop(member_id, None)
 
-        for invited_id in list(self.player_invites):
+        # Only this party's invitees can point at it; get_pending_invite drops any stray entry lazily.
+        for invited_id in party.invites:
             if self.player_invites.get(invited_id) == party_id:
-                self.player_invites.pop(invited_id, None)
+                del self.player_invites[invited_id]
 
-        self.mark_dirty()
+        self._dirty_party_ids.discard(party_id)
+        self._deleted_party_ids.add(party_id)
+        self.revision += 1
         return True
 
     def get_party(self, party_id: UUID) -> Party | None:
@@ -210,7 +316,7 @@ class PartyManager:
         self.player_invites[player_id] = party.id
         changed = True
         if changed:
-            self.mark_dirty()
+            self.mark_dirty(party.id)
         return True
 
     def get_pending_invite(self, player_id: UUID) -> Party | None:
@@ -232,7 +338,7 @@ class PartyManager:
         if now_ms() - sent_at > expiration_ms:
             party.remove_invite(player_id)
             self.player_invites.pop(player_id, None)
-            self.mark_dirty()
+            self.mark_dirty(party.id)
             return False
 
         max_members = self._config_cache.get("max_members", 8)
@@ -245,9 +351,10 @@ class PartyManager:
 
         party.add_member(player_id)
         self.player_to_party[player_id] = party.id
+        self._add_online_member(party.id, player_id)
         self.player_invites.pop(player_id, None)
         self.record_player_name(player)
-        self.mark_dirty()
+        self.mark_dirty(party.id)
         return True
 
     def leave_party(self, player_id: UUID) -> tuple[Party | None, UUID | None]:
@@ -259,8 +366,9 @@ class PartyManager:
 
         party.remove_member(player_id)
         self.player_to_party.pop(player_id, None)
+        self._discard_online_member(party.id, player_id)
         self.last_marker_positions.pop(player_id, None)
-        self.mark_dirty()
+        self.mark_dirty(party.id)
 
         if not party.members:
             self.disband_party(party.id)
@@ -271,18 +379,17 @@ class PartyManager:
             new_leader = self._pick_new_leader(party)
             if new_leader is not None:
                 party.transfer_leadership(new_leader)
-                self.mark_dirty()
+                self.mark_dirty(party.id)
 
         return party, new_leader
 
     def _pick_new_leader(self, party: Party) -> UUID | None:
         for member_id in party.members:
-            if self.plugin.server.get_player(member_id) is not None:
+            if member_id in self.online_players:
                 return member_id
 
-        for member_id in sorted(party.members, key=lambda value: str(value)):
-            return member_id
-        return None
+        # Same order as the string form, without formatting each UUID.
+        return min(party.members, key=attrgetter("int"), default=None)
 
     def kick_player(self, party: Party, player_id: UUID) -> bool:
         if player_id not in party.members:
@@ -290,14 +397,22 @@ class PartyManager:
 
         party.remove_member(player_id)
         self.player_to_party.pop(player_id, None)
+        self._discard_online_member(party.id, player_id)
         self.last_marker_positions.pop(player_id, None)
-        self.mark_dirty()
+        self.mark_dirty(party.id)
 
         if not party.members:
             self.disband_party(party.id)
 
         return True
 
+    def ban_player(self, party: Party, player_id: UUID) -> None:
+        party.ban_player(player_id)
+        self.player_to_party.pop(player_id, None)
+        self._discard_online_member(party.id, player_id)
+        self.last_marker_positions.pop(player_id, None)
+        self.mark_dirty(party.id)
+
     def add_player_to_party(self, player: "Player", party: Party) -> bool:
         if self.is_in_party(player.unique_id):
             return False
@@ -308,9 +423,10 @@ class PartyManager:
 
         party.add_member(player.unique_id)
         self.player_to_party[player.unique_id] = party.id
+        self._add_online_member(party.id, player.unique_id)
         self.player_invites.pop(player.unique_id, None)
         self.record_player_name(player)
-        self.mark_dirty()
+        self.mark_dirty(party.id)
         return True
 
     def remove_player_from_party(self, player_id: UUID) -> None:
@@ -322,7 +438,7 @@ class PartyManager:
         if target_party.has_join_request(requester_id):
             return False
         target_party.add_join_request(requester_id)
-        self.mark_dirty()
+        self.mark_dirty(target_party.id)
         return True
 
     def accept_join_request(self, target_party: Party, requester: "Player") -> bool:
@@ -330,19 +446,19 @@ class PartyManager:
         if not target_party.has_join_request(requester_id):
             return False
         target_party.remove_join_request(requester_id)
-        self.mark_dirty()
+        self.mark_dirty(target_party.id)
         return self.add_player_to_party(requester, target_party)
 
     def deny_join_request(self, target_party: Party, requester_id: UUID) -> bool:
         if not target_party.has_join_request(requester_id):
             return False
         target_party.remove_join_request(requester_id)
-        self.mark_dirty()
+        self.mark_dirty(target_party.id)
         return True
 
     def set_party_home(self, party: Party, location: Location) -> None:
         party.home = LocationData.from_location(location)
-        self.mark_dirty()
+        self.mark_dirty(party.id)
 
     def get_party_home_location(self, party: Party) -> Location | None:
         if party.home is None:
@@ -350,7 +466,7 @@ class PartyManager:
         return self._resolve_location(party.home)
 
     def teleport_to_party_home(self, player: "Player", party: Party) -> tuple[bool, str]:
-        if not bool(self.plugin.get_config("party.teleport-enabled", True)):
+        if not self._config_cache.get("teleport_enabled", True):
             return False, "teleport-disabled"
 
         location = self.get_party_home_location(party)
@@ -360,7 +476,7 @@ class PartyManager:
         if not self._can_teleport_to_location(player, location):
             return False, "teleport-too-far"
 
-        if bool(self.plugin.get_config("security.safe-teleport", True)) and not self._is_safe_teleport_location(location):
+        if self._config_cache.get("safe_teleport", True) and not self._is_safe_teleport_location(location):
             return False, "unsafe-location"
 
         teleported = bool(player.teleport(location))
@@ -371,7 +487,7 @@ class PartyManager:
         return True, "teleporting"
 
     def teleport_to_party_leader(self, player: "Player", party: Party) -> tuple[bool, str]:
-        if not bool(self.plugin.get_config("party.teleport-enabled", True)):
+        if not self._config_cache.get("teleport_enabled", True):
             return False, "teleport-disabled"
 
         leader = self.plugin.server.get_player(party.leader)
@@ -385,7 +501,7 @@ class PartyManager:
         if not self._can_teleport_to_location(player, target_location):
             return False, "teleport-too-far"
 
-        if bool(self.plugin.get_config("security.safe-teleport", True)) and not self._is_safe_teleport_location(target_location):
+        if self._config_cache.get("safe_teleport", True) and not self._is_safe_teleport_location(target_location):
             return False, "unsafe-location"
 
         teleported = bool(player.teleport(target_location))
@@ -463,31 +579,31 @@ class PartyManager:
 
     def cleanup_expired_invites(self) -> None:
         expiration_ms = self._config_cache.get("invite_expiration_ms", 300_000)
-        dirty = False
+        now = now_ms()
+        dirty_ids: list[UUID] = []
 
         for party in self.parties.values():
-            expired = party.clean_expired_invites(expiration_ms)
-            dirty = dirty or bool(expired)
+            expired = party.clean_expired_invites(expiration_ms, now)
             for expired_id in expired:
                 if self.player_invites.get(expired_id) == party.id:
                     self.player_invites.pop(expired_id, None)
-            expired_requests = party.clean_expired_join_requests(expiration_ms)
-            dirty = dirty or bool(expired_requests)
+            expired_requests = party.clean_expired_join_requests(expiration_ms, now)
+            if expired or expired_requests:
+                dirty_ids.append(party.id)
 
-        if dirty:
-            self.mark_dirty()
+        if dirty_ids:
+            self.mark_dirty(*dirty_ids)
 
-    def check_party_cleanup(self, party_id: UUID) -> None:
-        if not bool(self.plugin.get_config("party.disband-when-all-offline", False)):
+    def check_party_cleanup(self, party: Party) -> None:
+        if not self._config_cache.get("disband_when_all_offline", False):
             return
 
-        party = self.parties.get(party_id)
-        if party is None:
+        if self.parties.get(party.id) is not party:
             return
 
-        any_online = any(self.plugin.server.get_player(member_id) is not None for member_id in party.members)
-        if not any_online:
-            self.disband_party(party_id)
+        # The quitting player has already left the registry, so their own quit counts here.
+        if party.id not in self.party_online_members:
+            self.disband_party(party.id)
 
     def cleanup_player_state(self, player_id: UUID) -> None:
         self.last_command_use_ms.pop(player_id, None)
@@ -495,9 +611,8 @@ class PartyManager:
         self.last_marker_positions.pop(player_id, None)
 
     def broadcast_to_party(self, party: Party, message: str) -> None:
-        # Batch lookup of online players for better performance
-        online_players = {p.unique_id: p for p in self.plugin.server.online_players}
-        for member_id in party.members:
+        online_players = self.online_players
+        for member_id in party.member_snapshot:
             member = online_players.get(member_id)
             if member is not None:
                 member.send_message(message)
@@ -552,58 +667,57 @@ class PartyManager:
             return
 
         # Use cached config values for performance
-        max_distance = self._config_cache.get("marker_distance", 200.0)
-        max_distance_sq = max_distance * max_distance
+        max_distance_sq = self._config_cache.get("marker_distance_sq", 40_000.0)
         particle_name = self._config_cache.get("marker_particle", "minecraft:heart_particle")
         particle_count = self._config_cache.get("marker_particle_count", 3)
 
         optimize = self._config_cache.get("optimize_markers", True)
-        move_threshold = self._config_cache.get("marker_move_threshold", 1.0)
-        move_threshold_sq = move_threshold * move_threshold
+        move_threshold_sq = self._config_cache.get("marker_move_threshold_sq", 1.0)
 
-        online_players = {player.unique_id: player for player in self.plugin.server.online_players}
+        online_players = self.online_players
+        last_positions = self.last_marker_positions
 
-        for party in self.parties.values():
-            online_members = [online_players[member_id] for member_id in party.members if member_id in online_players]
-            if len(online_members) < 2:
+        for online_ids in self.party_online_members.values():
+            if len(online_ids) < 2:
                 continue
 
-            member_locations = [(member, member.location) for member in online_members]
+            # Read each member's position and dimension across the FFI once; the pairwise pass below only
+            # touches these plain values, instead of re-reading every target for every viewer.
+            snapshots = []
+            for member_id in online_ids:
+                member = online_players[member_id]
+                location = member.location
+                snapshots.append((member_id, member, location.x, location.y, location.z, member.dimension.name))
 
-            for viewer, viewer_location in member_locations:
+            for viewer_id, viewer, viewer_x, viewer_y, viewer_z, viewer_dim in snapshots:
                 if optimize:
-                    current_pos = (viewer_location.x, viewer_location.y, viewer_location.z)
-                    last_pos = self.last_marker_positions.get(viewer.unique_id)
-                    self.last_marker_positions[viewer.unique_id] = current_pos
-                    if last_pos is not None:
-                        dx = current_pos[0] - last_pos[0]
-                        dy = current_pos[1] - last_pos[1]
-                        dz = current_pos[2] - last_pos[2]
+                    # Positions are overwritten in place, which skips a tuple and a second UUID hash per viewer.
+                    last_pos = last_positions.get(viewer_id)
+                    if last_pos is None:
+                        last_positions[viewer_id] = [viewer_x, viewer_y, viewer_z]
+                    else:
+                        dx = viewer_x - last_pos[0]
+                        dy = viewer_y - last_pos[1]
+                        dz = viewer_z - last_pos[2]
+                        last_pos[0] = viewer_x
+                        last_pos[1] = viewer_y
+                        last_pos[2] = viewer_z
                         if (dx * dx) + (dy * dy) + (dz * dz) < move_threshold_sq:
                             continue
 
-                viewer_dim = viewer.dimension.name
-                for target, target_loc in member_locations:
-                    if target.unique_id == viewer.unique_id:
-                        continue
-                    if viewer_dim != target.dimension.name:
+                for _, target, target_x, target_y, target_z, target_dim in snapshots:
+                    if target is viewer or target_dim != viewer_dim:
                         continue
 
-                    dx = viewer_location.x - target_loc.x
-                    dy = viewer_location.y - target_loc.y
-                    dz = viewer_location.z - target_loc.z
+                    dx = viewer_x - target_x
+                    dy = viewer_y - target_y
+                    dz = viewer_z - target_z
                     if (dx * dx) + (dy * dy) + (dz * dz) > max_distance_sq:
                         continue
 
-                    # Spawn particles in a single batch
-                    target_y = target_loc.y + 2.5
+                    marker_y = target_y + 2.5
                     for _ in range(particle_count):
-                        viewer.spawn_particle(
-                            particle_name,
-                            target_loc.x,
-                            target_y,
-                            target_loc.z,
-                        )
+                        viewer.spawn_particle(particle_name, target_x, marker_y, target_z)
 
     def _start_playtime_task(self) -> None:
         if not bool(self.plugin.get_config("party.track-playtime", True)):
@@ -618,15 +732,16 @@ class PartyManager:
         )
 
     def _update_playtime(self) -> None:
-        updated = False
-        for party in self.parties.values():
-            if any(self.plugin.server.get_player(member_id) is not None for member_id in party.members):
+        updated: list[UUID] = []
+        for party_id in list(self.party_online_members):
+            party = self.parties.get(party_id)
+            if party is not None:
                 party.add_play_time(60_000)
                 self.plugin.achievement_manager.check(party)
-                updated = True
+                updated.append(party_id)
 
         if updated:
-            self.mark_dirty()
+            self.mark_dirty(*updated)
 
     def _start_cleanup_task(self) -> None:
         interval = int(self.plugin.get_config("performance.cleanup-interval", 6000))
@@ -642,16 +757,18 @@ class PartyManager:
     def _cleanup_memory(self) -> None:
         cutoff = now_ms() - (60 * 60 * 1000)
 
-        self.last_command_use_ms = {player_id: used_at for player_id, used_at in self.last_command_use_ms.items() if used_at >= cutoff}
-        self.last_teleport_ms = {player_id: used_at for player_id, used_at in self.last_teleport_ms.items() if used_at >= cutoff}
+        # Prune in place: usually only a few entries are stale, so copying the surviving ones is the bigger cost.
+        for timestamps in (self.last_command_use_ms, self.last_teleport_ms):
+            for player_id in [player_id for player_id, used_at in timestamps.items() if used_at < cutoff]:
+                del timestamps[player_id]
 
-        online_ids = {player.unique_id for player in self.plugin.server.online_players}
-        self.last_marker_positions = {
-            player_id: position for player_id, position in self.last_marker_positions.items() if player_id in online_ids
-        }
+        online_players = self.online_players
+        last_positions = self.last_marker_positions
+        for player_id in [player_id for player_id in last_positions if player_id not in online_players]:
+            del last_positions[player_id]
 
     def online_party_member_count(self, party: Party) -> int:
-        return sum(1 for member_id in party.members if self.plugin.server.get_player(member_id) is not None)
+        return len(self.party_online_members.get(party.id, ()))
 
     def all_parties(self) -> list[Party]:
         return list(self.parties.values())
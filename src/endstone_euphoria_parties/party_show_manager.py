@@ -61,7 +61,7 @@ class PartyShowManager:
         party = self.plugin.party_manager.get_player_party(player_id)
         if party is not None:
             party.last_seen[player_id] = timestamp
-            self.plugin.party_manager.mark_dirty()
+            self.plugin.party_manager.mark_dirty(party.id)
 
     def is_enabled(self, player_id: UUID) -> bool:
         return player_id in self.enabled_players
@@ -248,6 +248,7 @@ class PartyShowManager:
         return trimmed
 
     def _update_show(self) -> None:
+        now = now_ms()
         for player_id in list(self.enabled_players):
             player = self.plugin.server.get_player(player_id)
             if player is None:
@@ -260,39 +261,40 @@ class PartyShowManager:
                 self._clear(player)
                 continue
 
-            self._update_player_show(player, party)
+            self._update_player_show(player, party, now)
 
-    def _update_status(self, member_id: UUID, is_online: bool) -> None:
+    def _update_status(self, member_id: UUID, is_online: bool, now: int) -> None:
         current_status = self._online_status.get(member_id)
         if current_status is None:
             self._online_status[member_id] = is_online
-            self._status_since[member_id] = now_ms()
+            self._status_since[member_id] = now
             return
 
         if current_status != is_online:
             self._online_status[member_id] = is_online
-            self._status_since[member_id] = now_ms()
+            self._status_since[member_id] = now
 
-    def _update_player_show(self, player: "Player", party: "Party") -> None:
+    def _update_player_show(self, player: "Player", party: "Party", now: int | None = None) -> None:
         player_id = player.unique_id
         display_type = self._resolve_display_type(player_id)
         title = party.name if party.name else "Your Party"
 
-        now = now_ms()
+        if now is None:
+            now = now_ms()
         online_members = []
         offline_members = []
+        online_players = self.plugin.party_manager.online_players
         for member_id in party.members:
-            online = self.plugin.server.get_player(member_id) is not None
-            self._update_status(member_id, online)
+            online = member_id in online_players
+            self._update_status(member_id, online, now)
             if online:
                 online_members.append(member_id)
             else:
                 offline_members.append(member_id)
 
-        def sort_key(member_id: UUID) -> str:
-            name = self.plugin.party_manager.get_player_name(member_id)
-            return (name or str(member_id)).lower()
-
+        # get_player_name_lower is cached per player, so repeat refreshes don't re-lower every name.
+        sort_key = self.plugin.party_manager.get_player_name_lower
+        online_ids = set(online_members)
         members = sorted(online_members, key=sort_key) + sorted(offline_members, key=sort_key)
 
         lines: list[str] = []
@@ -300,7 +302,7 @@ class PartyShowManager:
         for member_id in members:
             name = self.plugin.party_manager.get_player_name(member_id) or "Unknown"
             role = party.get_role(member_id).value.capitalize()
-            online = member_id in online_members
+            online = member_id in online_ids
             if online:
                 since = self._status_since.get(member_id, now)
                 duration = self._format_duration(now - since)
@@ -192,7 +192,7 @@ class PartyScoreboardManager:
             self._update_player_scoreboard(player, party)
 
     def _update_player_scoreboard(self, player: "Player", party: "Party") -> None:
-        online_members = sum(1 for member_id in party.members if self.plugin.server.get_player(member_id) is not None)
+        online_members = self.plugin.party_manager.online_party_member_count(party)
 
         hours = party.total_play_time_ms // (1000 * 60 * 60)
         minutes = (party.total_play_time_ms // (1000 * 60)) % 60
@@ -4,13 +4,18 @@ from pathlib import Path
 from typing import Iterable, TYPE_CHECKING, Protocol
 from uuid import UUID
 
-from .models import Party
+from .models import Party, uuid_str
 
 try:
     import mysql.connector as mysql_connector
 except Exception:  # pragma: no cover - optional dependency
     mysql_connector = None
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
 if TYPE_CHECKING:
     from . import EuphoriaPartiesPlugin
 
@@ -22,6 +27,15 @@ class StorageBackend(Protocol):
     def save(self, parties: Iterable[Party], player_names: dict[UUID, str]) -> None:
         ...
 
+    def save_changes(
+        self,
+        parties: dict[UUID, Party],
+        changed: set[UUID],
+        deleted: set[UUID],
+        player_names: dict[UUID, str],
+    ) -> None:
+        ...
+
     def close(self) -> None:
         ...
 
@@ -76,7 +90,7 @@ class PartyStorage:
 
         serialized = [party.to_dict() for party in parties]
         names_payload = {
-            str(player_id): name
+            uuid_str(player_id): name
             for player_id, name in player_names.items()
             if name
         }
@@ -94,10 +108,24 @@ class PartyStorage:
                 pass
 
         temp_file = self.data_file.with_suffix(".json.tmp")
-        with temp_file.open("w", encoding="utf-8") as handle:
-            json.dump(payload, handle, indent=2, ensure_ascii=True)
+        if orjson is not None:
+            # The stdlib encoder drops to pure Python whenever indent is set; orjson keeps the same layout in C.
+            temp_file.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        else:
+            with temp_file.open("w", encoding="utf-8") as handle:
+                json.dump(payload, handle, indent=2, ensure_ascii=True)
         temp_file.replace(self.data_file)
 
+    def save_changes(
+        self,
+        parties: dict[UUID, Party],
+        changed: set[UUID],
+        deleted: set[UUID],
+        player_names: dict[UUID, str],
+    ) -> None:
+        # Everything lives in one file, so any change still means rewriting it.
+        self.save(parties.values(), player_names)
+
     def close(self) -> None:
         return None
 
@@ -236,13 +264,13 @@ class MySQLPartyStorage:
         connection = self._get_connection()
         party_rows = [
             (
-                str(party.id),
+                uuid_str(party.id),
                 json.dumps(party.to_dict(), separators=(",", ":"), ensure_ascii=True),
             )
             for party in parties
         ]
         name_rows = [
-            (str(player_id), name)
+            (uuid_str(player_id), name)
             for player_id, name in player_names.items()
             if name
         ]
@@ -277,6 +305,44 @@ class MySQLPartyStorage:
         finally:
             cursor.close()
 
+    def save_changes(
+        self,
+        parties: dict[UUID, Party],
+        changed: set[UUID],
+        deleted: set[UUID],
+        player_names: dict[UUID, str],
+    ) -> None:
+        party_rows = [
+            (
+                uuid_str(party_id),
+                json.dumps(party.to_dict(), separators=(",", ":"), ensure_ascii=True),
+            )
+            for party_id in changed
+            if (party := parties.get(party_id)) is not None
+        ]
+        deleted_rows = [(uuid_str(party_id),) for party_id in deleted]
+        if not party_rows and not deleted_rows:
+            return
+
+        upsert_sql = (
+            f"INSERT INTO `{self._table_name}` (party_id, payload) VALUES (%s, %s) "
+            "ON DUPLICATE KEY UPDATE payload = VALUES(payload)"
+        )
+
+        connection = self._get_connection()
+        cursor = connection.cursor()
+        try:
+            if party_rows:
+                cursor.executemany(upsert_sql, party_rows)
+            if deleted_rows:
+                cursor.executemany(f"DELETE FROM `{self._table_name}` WHERE party_id = %s", deleted_rows)
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            cursor.close()
+
     def close(self) -> None:
         if self._connection is not None:
             self._connection.close()
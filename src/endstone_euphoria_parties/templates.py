@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Mapping
+
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+# Compiled templates alternate literal text and placeholder names: (literal, key, literal, ..., literal).
+CompiledTemplate = tuple[str, ...]
+
+
+def compile_template(template: Any) -> CompiledTemplate:
+    return tuple(_PLACEHOLDER_RE.split(str(template)))
+
+
+def render_template(compiled: CompiledTemplate, values: Mapping[str, Any]) -> str:
+    if len(compiled) == 1:
+        return compiled[0]
+
+    parts = list(compiled)
+    for index in range(1, len(parts), 2):
+        key = parts[index]
+        if key in values:
+            parts[index] = str(values[key])
+        else:
+            # Unknown placeholders are left in place, matching the old str.replace behaviour.
+            parts[index] = "{" + key + "}"
+    return "".join(parts)
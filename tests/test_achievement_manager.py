@@ -0,0 +1,101 @@
+import sys
+import unittest
+from pathlib import Path
+from uuid import UUID, uuid4
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from endstone_euphoria_parties.achievement_manager import PartyAchievementManager
+from endstone_euphoria_parties.models import Party
+
+
+class DummyServer:
+    def get_player(self, _identifier: UUID):
+        return None
+
+
+class DummyMember:
+    def __init__(self) -> None:
+        self.unique_id = uuid4()
+        self.messages: list[str] = []
+        self.exp = 0
+
+    def send_message(self, message: str) -> None:
+        self.messages.append(message)
+
+    def give_exp(self, amount: int) -> None:
+        self.exp += amount
+
+
+class DummyPartyManager:
+    def __init__(self) -> None:
+        self.online_players: dict = {}
+
+    def mark_dirty(self, *_party_ids) -> None:
+        return None
+
+
+class DummyPlugin:
+    def __init__(self) -> None:
+        self.server = DummyServer()
+        self.party_manager = DummyPartyManager()
+
+    def get_config(self, _path: str, default=None):
+        return default
+
+
+class AchievementManagerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.plugin = DummyPlugin()
+        self.manager = PartyAchievementManager(self.plugin)
+
+    def test_check_skips_parties_without_stat_changes(self) -> None:
+        party = Party.create(uuid4())
+        self.manager.check(party)
+        self.assertTrue(party.has_achievement("party_started"))
+        self.assertFalse(party.achievements_stale)
+
+        # Without a stat change the next check is skipped, so a dropped unlock is not re-awarded.
+        party.achievements.discard("party_started")
+        self.manager.check(party)
+        self.assertFalse(party.has_achievement("party_started"))
+
+        for _ in range(10):
+            party.increment_kills()
+        self.manager.check(party)
+        self.assertTrue(party.has_achievement("first_blood"))
+        self.assertTrue(party.has_achievement("party_started"))
+
+    def test_unlock_sends_one_message_and_reward_per_online_member(self) -> None:
+        member = DummyMember()
+        self.plugin.party_manager.online_players[member.unique_id] = member
+        party = Party.create(member.unique_id)
+        party.add_member(uuid4())
+
+        self.manager.check(party)
+
+        self.assertEqual(len(member.messages), 1)
+        self.assertIn("Achievement Unlocked!", member.messages[0])
+        self.assertIn("+100 XP", member.messages[0])
+        self.assertEqual(member.exp, 100)
+
+    def test_simultaneous_unlocks_each_reach_online_members(self) -> None:
+        member = DummyMember()
+        self.plugin.party_manager.online_players[member.unique_id] = member
+        party = Party.create(member.unique_id)
+        for _ in range(4):
+            party.add_member(uuid4())
+
+        self.manager.check(party)
+
+        self.assertTrue(party.has_achievement("party_started"))
+        self.assertTrue(party.has_achievement("team_player"))
+        self.assertEqual(len(member.messages), 2)
+        self.assertEqual(member.exp, 350)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import sys
+import unittest
+from pathlib import Path
+from uuid import uuid4
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from endstone_euphoria_parties.leaderboard_manager import PartyLeaderboardManager
+from endstone_euphoria_parties.models import Party
+
+
+class DummyPartyManager:
+    def __init__(self) -> None:
+        self.parties: dict = {}
+        self.revision = 0
+
+    def add(self, party: Party) -> Party:
+        self.parties[party.id] = party
+        self.mark_dirty()
+        return party
+
+    def mark_dirty(self) -> None:
+        self.revision += 1
+
+
+class DummyPlugin:
+    def __init__(self) -> None:
+        self.party_manager = DummyPartyManager()
+
+
+class LeaderboardManagerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.plugin = DummyPlugin()
+        self.leaderboard = PartyLeaderboardManager(self.plugin)
+
+    def test_rankings_pair_parties_with_values(self) -> None:
+        quiet = self.plugin.party_manager.add(Party.create(uuid4()))
+        busy = self.plugin.party_manager.add(Party.create(uuid4()))
+        for _ in range(3):
+            busy.increment_kills()
+        busy.increment_deaths()
+        busy.add_play_time(2 * 60 * 60 * 1000 + 5)
+
+        self.assertEqual(self.leaderboard.top_by_kills(), [(busy, 3), (quiet, 0)])
+        self.assertEqual(self.leaderboard.top_by_kd(1), [(busy, 3.0)])
+        self.assertEqual(self.leaderboard.top_by_playtime(), [(busy, 2), (quiet, 0)])
+
+    def test_rankings_are_reused_until_party_data_changes(self) -> None:
+        first = self.plugin.party_manager.add(Party.create(uuid4()))
+        second = self.plugin.party_manager.add(Party.create(uuid4()))
+        first.increment_kills()
+        self.plugin.party_manager.mark_dirty()
+        self.assertEqual(self.leaderboard.top_by_kills(), [(first, 1), (second, 0)])
+
+        # Unreported changes are not picked up until the manager's revision moves.
+        second.increment_kills()
+        second.increment_kills()
+        self.assertEqual(self.leaderboard.top_by_kills(1), [(first, 1)])
+
+        self.plugin.party_manager.mark_dirty()
+        self.assertEqual(self.leaderboard.top_by_kills(1), [(second, 2)])
+
+    def test_rankings_are_rebuilt_for_a_new_party_manager(self) -> None:
+        old = self.plugin.party_manager.add(Party.create(uuid4()))
+        self.assertEqual(self.leaderboard.top_by_kills(), [(old, 0)])
+
+        # A fresh manager starts counting revisions from zero again, so the revisions alone would match.
+        replacement = DummyPartyManager()
+        new = replacement.add(Party.create(uuid4()))
+        self.plugin.party_manager = replacement
+        self.assertEqual(self.leaderboard.top_by_kills(), [(new, 0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 ﻿import sys
 import unittest
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 from uuid import uuid4
 
@@ -8,7 +9,7 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
-from endstone_euphoria_parties.models import Party, PartyRole
+from endstone_euphoria_parties.models import LocationData, Party, PartyRole, now_ms
 
 
 class PartyModelTests(unittest.TestCase):
@@ -25,6 +26,16 @@ class PartyModelTests(unittest.TestCase):
         self.assertEqual(party.get_role(officer), PartyRole.LEADER)
         self.assertEqual(party.get_role(leader), PartyRole.OFFICER)
 
+    def test_role_permissions_follow_rank(self) -> None:
+        self.assertTrue(PartyRole.LEADER.can_promote())
+        self.assertFalse(PartyRole.OFFICER.can_promote())
+        self.assertTrue(PartyRole.OFFICER.can_kick())
+        self.assertFalse(PartyRole.MEMBER.can_invite())
+        self.assertFalse(PartyRole.RECRUIT.can_ban_players())
+        self.assertGreater(PartyRole.MEMBER.level, PartyRole.RECRUIT.level)
+        self.assertIs(PartyRole.parse(" Officer "), PartyRole.OFFICER)
+        self.assertIs(PartyRole.parse("owner"), PartyRole.MEMBER)
+
     def test_daily_reward_streak_progression(self) -> None:
         player_id = uuid4()
         party = Party.create(player_id)
@@ -67,8 +78,100 @@ class PartyModelTests(unittest.TestCase):
         self.assertIn(member, restored.members)
         self.assertEqual(restored.total_kills, 7)
         self.assertEqual(restored.total_deaths, 2)
+        self.assertEqual(restored.kd_ratio, 3.5)
         self.assertIn("party_started", restored.achievements)
 
+    def test_from_dict_keeps_roles_for_members_only(self) -> None:
+        leader, officer, former = uuid4(), uuid4(), uuid4()
+        party = Party.create(leader)
+        party.add_member(officer)
+        party.set_role(officer, PartyRole.OFFICER)
+        data = party.to_dict()
+        data["members"] = [str(officer)]
+        data["roles"][str(former)] = "officer"
+        data["roles"][str(leader)] = "member"
+
+        restored = Party.from_dict(data)
+
+        self.assertEqual(restored.members, {leader, officer})
+        self.assertEqual(restored.roles, {leader: PartyRole.LEADER, officer: PartyRole.OFFICER})
+
+    def test_from_dict_skips_malformed_timestamp_entries(self) -> None:
+        party = Party.create(uuid4())
+        invited = uuid4()
+        data = party.to_dict()
+        data["invites"] = {str(invited): 5, "not-a-uuid": 6, str(uuid4()): "soon"}
+        data["last_seen"] = None
+
+        restored = Party.from_dict(data)
+
+        self.assertIsNotNone(restored)
+        self.assertEqual(restored.invites, {invited: 5})
+        self.assertEqual(restored.last_seen, {})
+
+    def test_location_data_is_an_immutable_value(self) -> None:
+        home = LocationData("world", "overworld", 1.0, 64.0, -3.5, yaw=90.0)
+        restored = LocationData.from_dict(home.to_dict())
+
+        self.assertEqual(restored, home)
+        self.assertEqual(len({home, restored}), 1)
+        with self.assertRaises(FrozenInstanceError):
+            home.x = 2.0
+
+    def test_member_snapshot_tracks_membership(self) -> None:
+        leader = uuid4()
+        member = uuid4()
+
+        party = Party.create(leader)
+        self.assertEqual(party.member_snapshot, (leader,))
+        self.assertIs(party.member_snapshot, party.member_snapshot)
+
+        party.add_member(member)
+        self.assertCountEqual(party.member_snapshot, (leader, member))
+
+        party.remove_member(leader)
+        self.assertEqual(party.member_snapshot, (member,))
+
+    def test_serialized_members_follow_membership_changes(self) -> None:
+        leader = uuid4()
+        member = uuid4()
+
+        party = Party.create(leader)
+        self.assertEqual(party.to_dict()["members"], [str(leader)])
+
+        party.add_member(member)
+        self.assertEqual(party.to_dict()["members"], sorted([str(leader), str(member)]))
+
+        party.ban_player(leader)
+        self.assertEqual(party.to_dict()["members"], [str(member)])
+
+    def test_clean_expired_drops_only_stale_entries(self) -> None:
+        party = Party.create(uuid4())
+        stale, fresh = uuid4(), uuid4()
+        party.invites[stale] = now_ms() - 10_000
+        party.invites[fresh] = now_ms()
+        party.join_requests[stale] = now_ms() - 10_000
+
+        self.assertEqual(party.clean_expired_invites(5_000), {stale})
+        self.assertEqual(list(party.invites), [fresh])
+        self.assertEqual(party.clean_expired_join_requests(5_000), {stale})
+        self.assertEqual(party.join_requests, {})
+        self.assertEqual(party.clean_expired_invites(5_000), set())
+
+    def test_kd_ratio_follows_kills_and_deaths(self) -> None:
+        party = Party.create(uuid4())
+        self.assertEqual(party.kd_ratio, 0.0)
+
+        party.increment_kills()
+        party.increment_kills()
+        self.assertEqual(party.kd_ratio, 2.0)
+
+        party.increment_deaths()
+        party.increment_deaths()
+        party.increment_deaths()
+        party.increment_deaths()
+        self.assertEqual(party.kd_ratio, 0.5)
+
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main()
@@ -30,6 +30,18 @@ class DummyLogger:
         return None
 
 
+class RecordingStorage:
+    def __init__(self) -> None:
+        self.full_saves = 0
+        self.changes: list[tuple[set[UUID], set[UUID]]] = []
+
+    def save(self, _parties, _player_names) -> None:
+        self.full_saves += 1
+
+    def save_changes(self, _parties, changed, deleted, _player_names) -> None:
+        self.changes.append((set(changed), set(deleted)))
+
+
 class DummyPlayer:
     def __init__(self, name: str, unique_id: UUID | None = None) -> None:
         self.name = name
@@ -132,6 +144,18 @@ class PartyManagerTests(unittest.TestCase):
         self.assertEqual(new_leader, member.unique_id)
         self.assertEqual(party.leader, member.unique_id)
 
+    def test_offline_party_passes_leadership_to_lowest_uuid(self) -> None:
+        leader = DummyPlayer("Leader")
+        low = DummyPlayer("Low", UUID(int=1))
+        high = DummyPlayer("High", UUID(int=2**127))
+        party = self.manager.create_party(leader)
+        assert party is not None
+        self.manager.add_player_to_party(high, party)
+        self.manager.add_player_to_party(low, party)
+
+        _, new_leader = self.manager.leave_party(leader.unique_id)
+        self.assertEqual(new_leader, low.unique_id)
+
     def test_command_cooldown_tracking(self) -> None:
         player_id = uuid4()
         self.assertFalse(self.manager.is_on_command_cooldown(player_id))
@@ -143,6 +167,22 @@ class PartyManagerTests(unittest.TestCase):
         self.manager.last_command_use_ms[player_id] = 0
         self.assertFalse(self.manager.is_on_command_cooldown(player_id))
 
+    def test_cleanup_memory_prunes_stale_entries(self) -> None:
+        online = DummyPlayer("Online")
+        self.manager.record_player_online(online)
+        stale_id = uuid4()
+        self.manager.update_command_cooldown(online.unique_id)
+        self.manager.last_command_use_ms[stale_id] = 0
+        self.manager.last_teleport_ms[stale_id] = 0
+        self.manager.last_marker_positions[online.unique_id] = [0.0, 0.0, 0.0]
+        self.manager.last_marker_positions[stale_id] = [0.0, 0.0, 0.0]
+
+        self.manager._cleanup_memory()
+
+        self.assertEqual(list(self.manager.last_command_use_ms), [online.unique_id])
+        self.assertEqual(self.manager.last_teleport_ms, {})
+        self.assertEqual(list(self.manager.last_marker_positions), [online.unique_id])
+
     def test_cleanup_expired_invites_updates_lookup(self) -> None:
         leader = DummyPlayer("Leader")
         invitee = DummyPlayer("Invitee")
@@ -159,6 +199,137 @@ class PartyManagerTests(unittest.TestCase):
         self.assertNotIn(invitee.unique_id, party.invites)
         self.assertNotIn(invitee.unique_id, self.manager.player_invites)
 
+    def test_disband_clears_only_its_own_invites(self) -> None:
+        first_leader = DummyPlayer("First")
+        second_leader = DummyPlayer("Second")
+        invitee = DummyPlayer("Invitee")
+        for player in (first_leader, second_leader, invitee):
+            self.server.add_player(player)
+
+        first = self.manager.create_party(first_leader)
+        second = self.manager.create_party(second_leader)
+        assert first is not None and second is not None
+        self.manager.invite_player(first, invitee.unique_id)
+        self.manager.invite_player(second, invitee.unique_id)
+
+        self.manager.disband_party(first.id)
+        self.assertIs(self.manager.get_pending_invite(invitee.unique_id), second)
+
+        self.manager.disband_party(second.id)
+        self.assertNotIn(invitee.unique_id, self.manager.player_invites)
+
+    def test_last_member_quitting_disbands_when_configured(self) -> None:
+        leader = DummyPlayer("Leader")
+        self.server.add_player(leader)
+        self.manager.record_player_online(leader)
+        party = self.manager.create_party(leader)
+        assert party is not None
+        self.manager._config_cache["disband_when_all_offline"] = True
+
+        # During the quit event the server still lists the player; the registry already does not.
+        self.manager.record_player_offline(leader.unique_id)
+        self.manager.check_party_cleanup(party)
+
+        self.assertIsNone(self.manager.get_party(party.id))
+
+    def test_online_player_registry(self) -> None:
+        existing = DummyPlayer("Existing")
+        self.server.add_player(existing)
+        self.manager.start()
+        self.assertIs(self.manager.online_players.get(existing.unique_id), existing)
+
+        joined = DummyPlayer("Joined")
+        self.manager.record_player_online(joined)
+        self.assertIs(self.manager.online_players.get(joined.unique_id), joined)
+
+        self.manager.record_player_offline(existing.unique_id)
+        self.assertNotIn(existing.unique_id, self.manager.online_players)
+
+    def test_online_party_member_count_uses_registry(self) -> None:
+        leader = DummyPlayer("Leader")
+        member = DummyPlayer("Member")
+        self.manager.record_player_online(leader)
+        party = self.manager.create_party(leader)
+        assert party is not None
+        self.assertTrue(self.manager.add_player_to_party(member, party))
+        self.assertEqual(self.manager.online_party_member_count(party), 1)
+
+        self.manager.record_player_online(member)
+        self.assertEqual(self.manager.online_party_member_count(party), 2)
+
+        self.manager.record_player_offline(leader.unique_id)
+        self.assertEqual(self.manager.online_party_member_count(party), 1)
+
+    def test_online_members_index_follows_membership_changes(self) -> None:
+        leader = DummyPlayer("Leader")
+        member = DummyPlayer("Member")
+        self.manager.record_player_online(leader)
+        self.manager.record_player_online(member)
+        party = self.manager.create_party(leader)
+        assert party is not None
+        self.manager.add_player_to_party(member, party)
+        self.assertEqual(self.manager.party_online_members[party.id], {leader.unique_id, member.unique_id})
+
+        self.manager.kick_player(party, member.unique_id)
+        self.assertEqual(self.manager.party_online_members[party.id], {leader.unique_id})
+
+        self.manager.disband_party(party.id)
+        self.assertNotIn(party.id, self.manager.party_online_members)
+
+    def test_save_all_writes_only_touched_parties(self) -> None:
+        leader = DummyPlayer("Leader")
+        other = DummyPlayer("Other")
+        party = self.manager.create_party(leader)
+        doomed = self.manager.create_party(other)
+        assert party is not None and doomed is not None
+        storage = RecordingStorage()
+        self.manager.storage = storage
+        self.manager.save_all(force=True)
+        self.assertEqual(storage.full_saves, 1)
+
+        self.manager.invite_player(party, uuid4())
+        self.manager.disband_party(doomed.id)
+        self.manager.save_all()
+        self.assertEqual(storage.changes, [({party.id}, {doomed.id})])
+        self.assertEqual(storage.full_saves, 1)
+
+        self.manager.save_all()
+        self.assertEqual(len(storage.changes), 1)
+
+    def test_lowercase_name_cache_follows_renames(self) -> None:
+        player = DummyPlayer("Alice")
+        self.manager.record_player_name(player)
+        self.assertEqual(self.manager.get_player_name_lower(player.unique_id), "alice")
+
+        player.name = "ALICIA"
+        self.manager.record_player_name(player)
+        self.assertEqual(self.manager.get_player_name_lower(player.unique_id), "alicia")
+
+    def test_name_index_tracks_renames(self) -> None:
+        player = DummyPlayer("Alice")
+        self.manager.record_player_name(player)
+        self.assertEqual(self.manager.find_player_id_by_name(" ALICE "), player.unique_id)
+
+        player.name = "Alicia"
+        self.manager.record_player_name(player)
+        self.assertIsNone(self.manager.find_player_id_by_name("alice"))
+        self.assertEqual(self.manager.find_player_id_by_name("alicia"), player.unique_id)
+
+    def test_find_online_player_by_name(self) -> None:
+        player = DummyPlayer("Alice")
+        self.server.add_player(player)
+        self.manager.record_player_name(player)
+        self.manager.record_player_online(player)
+        self.assertIs(self.manager.find_online_player("ALICE"), player)
+
+        self.server.remove_player(player.unique_id)
+        self.manager.record_player_offline(player.unique_id)
+        self.assertIsNone(self.manager.find_online_player("alice"))
+
+        unindexed = DummyPlayer("Bob")
+        self.server.add_player(unindexed)
+        self.assertIs(self.manager.find_online_player("bob"), unindexed)
+
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main()
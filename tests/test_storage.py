@@ -77,6 +77,17 @@ class PartyStorageTests(unittest.TestCase):
             storage.save([Party.create(leader_b)], {})
             self.assertTrue(backup_file.exists())
 
+    def test_save_changes_rewrites_the_whole_file(self) -> None:
+        kept = Party.create(uuid4())
+        touched = Party.create(uuid4())
+
+        with tempfile.TemporaryDirectory() as td:
+            storage = PartyStorage(Path(td) / "parties.json")
+            storage.save_changes({kept.id: kept, touched.id: touched}, {touched.id}, {uuid4()}, {})
+            loaded, _ = storage.load()
+
+            self.assertEqual(set(loaded), {kept.id, touched.id})
+
     def test_create_storage_resolves_relative_json_path(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             plugin = DummyPlugin(
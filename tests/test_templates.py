@@ -0,0 +1,30 @@
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from endstone_euphoria_parties.templates import compile_template, render_template
+
+
+class TemplateTests(unittest.TestCase):
+    def test_render_substitutes_known_placeholders(self) -> None:
+        compiled = compile_template("\u00a7e{player} invited you to {party}!")
+        rendered = render_template(compiled, {"player": "Alice", "party": "Crew"})
+        self.assertEqual(rendered, "\u00a7eAlice invited you to Crew!")
+
+    def test_render_keeps_unknown_placeholders_and_literal_braces(self) -> None:
+        compiled = compile_template("{seconds}s left {} {{x}}")
+        self.assertEqual(render_template(compiled, {}), "{seconds}s left {} {{x}}")
+        self.assertEqual(render_template(compiled, {"seconds": 3, "x": 1}), "3s left {} {1}")
+
+    def test_values_are_not_rescanned(self) -> None:
+        compiled = compile_template("{player}: {message}")
+        self.assertEqual(render_template(compiled, {"player": "{message}", "message": "hi"}), "{message}: hi")
+
+
+if __name__ == "__main__":
+    unittest.main()